@@ -547,8 +547,10 @@ class SourceDetectionWidgetController:
             
             # 添加更多的UI更新
             if progress % 5 == 0:  # 每5%更新一次状态文本
-                self.view.update_status_text(f"计算中...进度: {progress}%, 单位: {单位}")
-                QApplication.processEvents()  # 强制更新UI
+                # 回调运行在工作线程中，状态文本需排队到主线程更新
+                QMetaObject.invokeMethod(self.view, "update_status_text",
+                                       Qt.ConnectionType.QueuedConnection,
+                                       Q_ARG(str, f"计算中...进度: {progress}%, 单位: {单位}"))
                 
             return result
         
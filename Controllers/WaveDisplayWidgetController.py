@@ -130,7 +130,7 @@ class WaveDisplayWidgetController:
             if file_path:
                 logger.info(f"保存图像到: {file_path}")
                 # 保存图像
-                self.wave_display_widget.fig.savefig(
+                self.wave_display_widget.export_figure(
                     file_path, 
                     dpi=300, 
                     bbox_inches='tight',
@@ -159,11 +159,8 @@ class WaveDisplayWidgetController:
     def handle_zoom_change(self, value):
         """处理缩放滑块值变化事件"""
         logger.debug(f"执行handle_zoom_change: {value}")
-        # 更新缩放标签
-        self.wave_display_widget.zoom_label.setText(f"缩放: {value}%")
-        
-        # 使用WaveDisplayWidget的内置方法
-        self.wave_display_widget.update_zoom(value)
+        # 使用WaveDisplayWidget的内置方法，标签立即更新，重绘经防抖后执行
+        self.wave_display_widget.schedule_zoom(value)
             
     def handle_display_type_change(self, button):
         """处理显示类型变更事件"""
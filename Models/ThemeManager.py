@@ -20,6 +20,9 @@ class ThemeManager:
         # 默认主题
         self.current_theme = "light"
         
+        # 已生成的样式表缓存，主题变更时清空
+        self._stylesheet_cache = {}
+        
         # 预定义主题
         self.themes = {
             "light": {
@@ -172,6 +175,7 @@ class ThemeManager:
         """设置当前主题"""
         if theme_name in self.themes:
             self.current_theme = theme_name
+            self._stylesheet_cache.clear()
             self.config.set("Theme", "current_theme", theme_name)
             return True
         return False
@@ -182,7 +186,21 @@ class ThemeManager:
         return theme.get(color_key, "#000000")
     
     def get_stylesheet(self):
-        """获取当前主题的样式表"""
+        """获取当前主题的样式表，同一主题下只生成一次"""
+        stylesheet = self._stylesheet_cache.get("app")
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache["app"] = self._build_stylesheet()
+        return stylesheet
+    
+    def get_sidebar_stylesheet(self):
+        """获取侧边栏的样式表，同一主题下只生成一次"""
+        stylesheet = self._stylesheet_cache.get("sidebar")
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache["sidebar"] = self._build_sidebar_stylesheet()
+        return stylesheet
+    
+    def _build_stylesheet(self):
+        """生成当前主题的样式表"""
         theme = self.themes.get(self.current_theme, self.themes["light"])
         
         return f"""
@@ -384,8 +402,8 @@ class ThemeManager:
             }}
         """
     
-    def get_sidebar_stylesheet(self):
-        """获取侧边栏的样式表"""
+    def _build_sidebar_stylesheet(self):
+        """生成侧边栏的样式表"""
         theme = self.themes.get(self.current_theme, self.themes["light"])
         
         return f"""
@@ -438,6 +456,7 @@ class ThemeManager:
         """保存自定义主题"""
         if isinstance(colors, dict):
             self.themes["custom"] = colors
+            self._stylesheet_cache.clear()
             import json
             self.config.set("Theme", "custom_theme", json.dumps(colors))
             return True
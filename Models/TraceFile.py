@@ -57,9 +57,33 @@ class TraceFile(QObject):
               {self.time_range == None}
         """)
 
-    # 加载波形数据文件
-    def load_wave_data(self, wave_file_path: str):
-        # 先重置数据，但不重置实例
+    # 读取波形数据文件，不修改单例中的数据，可在后台线程中调用
+    @staticmethod
+    def read_wave_data(wave_file_path: str):
+        """
+        打开 SEGY 文件并读取基本信息
+
+        返回:
+        - wave_data: segyio 的 trace 对象
+        - basic_info: 文件基本信息
+        """
+        try:
+            segy_file = segyio.open(wave_file_path, 'r', ignore_geometry=True)
+        except Exception as e:
+            raise Exception(f"无法打开 SEGY 文件：{str(e)}")
+
+        file_name = os.path.basename(wave_file_path)
+        basic_info = {
+            "file_name": file_name, 
+            "trace_count": segy_file.tracecount, 
+            "sample_interval": segy_file.header[0][segyio.TraceField.TRACE_SAMPLE_INTERVAL] * 1e-6, 
+            "sample_count": segy_file.header[0][segyio.TraceField.TRACE_SAMPLE_COUNT]
+        }
+        return segy_file.trace, basic_info
+
+    # 将读取好的波形数据写入单例
+    def set_wave_data(self, wave_data, basic_info):
+        # 关闭之前打开的文件，但不重置实例
         if self.wave_data is not None:
             try:
                 # 如果是 segyio 对象，尝试关闭它
@@ -68,35 +92,21 @@ class TraceFile(QObject):
             except:
                 pass
         
-        # 重置实例变量
-        self.basic_info = None
-        self.wave_data = None
+        self.wave_data = wave_data
+        self.basic_info = basic_info
         self.time_range = None
         
-        try:
-            segy_file = segyio.open(wave_file_path, 'r', ignore_geometry=True)
-        except Exception as e:
-            raise Exception(f"无法打开 SEGY 文件：{str(e)}")
+        print(f"成功加载波形文件: {basic_info['file_name']}, 共 {basic_info['trace_count']} 条记录")
 
-        self.wave_data = segy_file.trace
-        self.time_range = None
-        
-        file_name = os.path.basename(wave_file_path)
-        trace_count = segy_file.tracecount
-        sample_interval = segy_file.header[0][segyio.TraceField.TRACE_SAMPLE_INTERVAL] * 1e-6
-        sample_count = segy_file.header[0][segyio.TraceField.TRACE_SAMPLE_COUNT]
-        self.basic_info = {
-            "file_name": file_name, 
-            "trace_count": trace_count, 
-            "sample_interval": sample_interval, 
-            "sample_count": sample_count
-        }
-        
-        print(f"成功加载波形文件: {file_name}, 共 {trace_count} 条记录")
+    # 加载波形数据文件
+    def load_wave_data(self, wave_file_path: str):
+        wave_data, basic_info = self.read_wave_data(wave_file_path)
+        self.set_wave_data(wave_data, basic_info)
     
 
-    # 加载位置信息文件
-    def load_location_data(self, location_file_path):
+    # 读取位置信息文件，不修改单例中的数据，可在后台线程中调用
+    @staticmethod
+    def read_location_data(location_file_path):
         try:
             POSITION = pd.read_excel(location_file_path)
         except Exception as e:
@@ -106,8 +116,16 @@ class TraceFile(QObject):
         if not all(col in POSITION.columns for col in ['x', 'y', 'z', 'trace_number']):
             raise Exception("位置信息文件必须包含 x, y, z 和 trace_number 列！")
         
-        self.location_data = POSITION
-        print(f"成功加载位置信息文件: {os.path.basename(location_file_path)}, 共 {len(POSITION)} 条记录")
+        return POSITION
+
+    # 将读取好的位置信息写入单例
+    def set_location_data(self, location_data):
+        self.location_data = location_data
+        print(f"成功加载位置信息文件, 共 {len(location_data)} 条记录")
+
+    # 加载位置信息文件
+    def load_location_data(self, location_file_path):
+        self.set_location_data(self.read_location_data(location_file_path))
     
 
     # 读取文件信息
@@ -0,0 +1,149 @@
+import numpy as np
+from functools import lru_cache, partial
+
+# numba为可选依赖：可用时按个体并行计算，不可用时退回到NumPy向量化实现
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _make_fitness_loop(window_size):
+    """
+    生成半窗口长度固定为window_size的种群亮度计算循环
+
+    window_size作为闭包常量参与编译，窗口内取最大值的循环次数固定，编译器可以将其完全展开
+    """
+    def _population_fitness_loop(pop, det_x, det_y, det_z, norm_mat, trace_lengths, sample_interval, speed):
+        """
+        逐个体、逐检波器计算种群的亮度值，不产生中间数组
+
+        参数:
+        - pop: 种群，形状为(P, 4)，每行为x, y, z, t
+        - det_x, det_y, det_z: 检波器坐标
+        - norm_mat: 归一化后的各道数据，形状为(n_traces, n_samples)
+        - trace_lengths: 各道的实际长度
+        - sample_interval: 采样间隔
+        - speed: 波速
+
+        返回:
+        - 形状为(P,)的亮度值，没有有效检波器的个体亮度为0
+        """
+        n_pop = pop.shape[0]
+        n_traces = det_x.shape[0]
+        out = np.zeros(n_pop)
+        # 预先计算倒数，采样点序号 = t / Δt + d / (v·Δt)，内层循环中不再做除法
+        inv_dt = 1.0 / sample_interval
+        inv_speed_dt = 1.0 / (speed * sample_interval)
+        for p in prange(n_pop):
+            x = pop[p, 0]
+            y = pop[p, 1]
+            z = pop[p, 2]
+            t = pop[p, 3]
+            total = 0.0
+            count = 0
+            for i in range(n_traces):
+                n = trace_lengths[i]
+                # 到时不早于该道结束时间的检波器直接跳过：用距离平方比较，不必开方
+                max_distance = speed * (n * sample_interval - t)
+                if max_distance <= 0:
+                    continue
+                dx = x - det_x[i]
+                dy = y - det_y[i]
+                dz = z - det_z[i]
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 >= max_distance * max_distance:
+                    continue
+                position = t * inv_dt + np.sqrt(d2) * inv_speed_dt
+                if position < 0:
+                    continue
+                sample_index = min(int(position), n - 1)
+                # 固定次数的窗口循环，越界的采样点夹到该道的首尾（与np.clip一致，不影响最大值）
+                local_max = norm_mat[i, max(sample_index - window_size, 0)]
+                for w in range(-window_size, window_size + 1):
+                    j = min(max(sample_index + w, 0), n - 1)
+                    if norm_mat[i, j] > local_max:
+                        local_max = norm_mat[i, j]
+                total += local_max
+                count += 1
+            if count > 0:
+                out[p] = total / count
+        return out
+
+    return _population_fitness_loop
+
+
+def _population_fitness_numpy(pop, det_x, det_y, det_z, norm_mat, trace_lengths, sample_interval, speed, window_size):
+    """NumPy版本的种群亮度计算，结果与_make_fitness_loop生成的循环一致"""
+    # 计算所有个体到所有检波器的到时，形状为(P, n_traces)
+    dx = pop[:, 0:1] - det_x
+    dy = pop[:, 1:2] - det_y
+    dz = pop[:, 2:3] - det_z
+    arrival_time = pop[:, 3:4] + np.sqrt(dx * dx + dy * dy + dz * dz) / speed
+
+    # 只统计到时在各道有效时间范围内的检波器
+    valid = (arrival_time >= 0) & (arrival_time < trace_lengths * sample_interval)
+
+    # 取各道到时附近窗口内的局部最大值作为振幅，窗口限制在该道的实际长度内
+    sample_index = (np.where(valid, arrival_time, 0) / sample_interval).astype(np.int64)
+    window = np.clip(sample_index[:, :, None] + np.arange(-window_size, window_size + 1),
+                     0, (trace_lengths - 1)[:, None])
+    amplitudes = norm_mat[np.arange(det_x.shape[0])[:, None], window].max(axis=2)
+
+    # 按有效检波器数量归一化亮度值，没有有效检波器时亮度为0
+    valid_count = valid.sum(axis=1)
+    return np.where(valid, amplitudes, 0).sum(axis=1) / np.maximum(valid_count, 1)
+
+
+@lru_cache(maxsize=8)
+def _fitness_kernel(window_size):
+    """获取针对指定半窗口长度特化的亮度计算内核，每种窗口长度只编译一次"""
+    if njit is not None:
+        return njit(parallel=True, fastmath=True, cache=True)(_make_fitness_loop(window_size))
+    return partial(_population_fitness_numpy, window_size=window_size)
+
+
+def population_fitness(pop, det_x, det_y, det_z, norm_mat, trace_lengths, sample_interval, speed, window_size):
+    """
+    计算种群中每个个体的亮度值
+
+    参数含义见_make_fitness_loop，window_size为取局部最大值的半窗口长度
+
+    返回:
+    - 形状为(P,)的亮度值，没有有效检波器的个体亮度为0
+    """
+    return _fitness_kernel(window_size)(pop, det_x, det_y, det_z, norm_mat, trace_lengths, sample_interval, speed)
+
+
+def _mutate_inplace_loop(offspring, rate, step, low, high):
+    """
+    单次遍历完成变异和边界裁剪，直接修改offspring
+
+    参数:
+    - offspring: 子代个体，形状为(P, 4)
+    - rate: 每个基因的变异概率
+    - step: 各基因的最大变异幅度，变异值在[-step, step]内均匀分布
+    - low, high: 各基因的取值边界
+    """
+    n_genes = offspring.shape[1]
+    for i in prange(offspring.shape[0]):
+        for k in range(n_genes):
+            value = offspring[i, k]
+            if np.random.random() < rate:
+                value += np.random.uniform(-step[k], step[k])
+            offspring[i, k] = min(max(value, low[k]), high[k])
+
+
+def _mutate_inplace_numpy(offspring, rate, step, low, high):
+    """NumPy版本的变异和边界裁剪，行为与_mutate_inplace_loop一致"""
+    mutation_mask = np.random.random(offspring.shape) < rate
+    mutation_values = np.random.uniform(-step, step, size=offspring.shape)
+    offspring += mutation_mask * mutation_values
+    np.clip(offspring, low, high, out=offspring)
+
+
+if njit is not None:
+    mutate_inplace = njit(parallel=True, fastmath=True, cache=True)(_mutate_inplace_loop)
+else:
+    mutate_inplace = _mutate_inplace_numpy
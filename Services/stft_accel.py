@@ -0,0 +1,147 @@
+import numpy as np
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import get_window
+
+# jax与numba均为可选依赖：优先使用jax（XLA编译，可使用GPU），其次使用numba并行分帧，
+# 两者都不可用时退回到NumPy的滑动窗口视图
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:
+    jax = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+if jax is not None:
+    from functools import partial
+
+    @partial(jax.jit, static_argnums=(2, 3))
+    def _stft_power_jax(y, win, nperseg, hop):
+        """使用jax计算各分段加窗后的功率谱 |rfft|²，形状为(n_frames, n_freqs)"""
+        n_frames = (y.shape[0] - nperseg) // hop + 1
+        idx = jnp.arange(n_frames)[:, None] * hop + jnp.arange(nperseg)[None, :]
+        spec = jnp.fft.rfft(y[idx] * win, axis=1)
+        return spec.real * spec.real + spec.imag * spec.imag
+
+
+def _frame_windowed_loop(y, win, hop):
+    """将信号切分为重叠分段并加窗，返回形状为(n_frames, nperseg)的连续数组"""
+    nperseg = win.shape[0]
+    n_frames = (y.shape[0] - nperseg) // hop + 1
+    frames = np.empty((n_frames, nperseg), dtype=np.float32)
+    for i in prange(n_frames):
+        start = i * hop
+        for j in range(nperseg):
+            frames[i, j] = y[start + j] * win[j]
+    return frames
+
+
+def _frame_windowed_numpy(y, win, hop):
+    """NumPy版本的分段加窗，结果与_frame_windowed_loop一致"""
+    nperseg = win.shape[0]
+    return np.lib.stride_tricks.sliding_window_view(y, nperseg)[::hop] * win
+
+
+def _frame_detrended_loop(y, win, hop):
+    """将信号切分为重叠分段，每段去均值后加窗，返回形状为(n_frames, nperseg)的连续数组"""
+    nperseg = win.shape[0]
+    n_frames = (y.shape[0] - nperseg) // hop + 1
+    frames = np.empty((n_frames, nperseg), dtype=np.float32)
+    for i in prange(n_frames):
+        start = i * hop
+        total = 0.0
+        for j in range(nperseg):
+            total += y[start + j]
+        mean = total / nperseg
+        for j in range(nperseg):
+            frames[i, j] = (y[start + j] - mean) * win[j]
+    return frames
+
+
+def _frame_detrended_numpy(y, win, hop):
+    """NumPy版本的分段去均值加窗，结果与_frame_detrended_loop一致"""
+    nperseg = win.shape[0]
+    frames = np.lib.stride_tricks.sliding_window_view(y, nperseg)[::hop]
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    frames *= win
+    return frames
+
+
+if njit is not None:
+    _frame_windowed = njit(parallel=True, cache=True)(_frame_windowed_loop)
+    _frame_detrended = njit(parallel=True, fastmath=True, cache=True)(_frame_detrended_loop)
+else:
+    _frame_windowed = _frame_windowed_numpy
+    _frame_detrended = _frame_detrended_numpy
+
+
+def welch(y, fs, win, scaling='density', detrend=True):
+    """
+    Welch法估计功率谱，结果与scipy.signal.welch（50%重叠）一致
+    
+    detrend为True时各分段先去均值（对应detrend='constant'），为False时不去趋势。
+    分段、去均值和加窗在numba并行循环中一次完成，所有分段再由一次批量rfft计算
+    
+    返回:
+    - f: 频率轴
+    - Pxx: 功率谱密度（scaling='density'）或功率谱（scaling='spectrum'）
+    """
+    y = np.ascontiguousarray(y, dtype=np.float32)
+    win = np.ascontiguousarray(win, dtype=np.float32)
+    nperseg = win.shape[0]
+    hop = nperseg - nperseg // 2
+    
+    frames = _frame_detrended(y, win, hop) if detrend else _frame_windowed(y, win, hop)
+    spec = rfft(frames, axis=1, workers=-1)
+    Pxx = (spec.real * spec.real + spec.imag * spec.imag).mean(axis=0)
+    
+    if scaling == 'density':
+        Pxx *= 1.0 / (fs * float(np.dot(win, win)))
+    else:
+        Pxx *= 1.0 / float(win.sum()) ** 2
+    # 单边谱除直流和奈奎斯特分量外乘2
+    if nperseg % 2:
+        Pxx[1:] *= 2
+    else:
+        Pxx[1:-1] *= 2
+    
+    return rfftfreq(nperseg, d=1.0 / fs), Pxx
+
+
+def spectrogram(y, fs, nperseg=256, noverlap=128):
+    """
+    计算长信号的时频图功率谱密度
+
+    结果与scipy.signal.spectrogram(window='hann', detrend=False,
+    scaling='density', mode='psd')一致，用于百万点以上的长波形
+
+    返回:
+    - freqs: 频率轴
+    - bins: 各分段的中心时间
+    - Pxx: 功率谱密度矩阵，形状为(n_freqs, n_frames)
+    """
+    y = np.ascontiguousarray(y, dtype=np.float32)
+    hop = nperseg - noverlap
+    win = get_window('hann', nperseg).astype(np.float32)
+
+    if jax is not None:
+        power = np.array(_stft_power_jax(jnp.asarray(y), jnp.asarray(win), nperseg, hop))
+    else:
+        spec = rfft(_frame_windowed(y, win, hop), axis=1, workers=-1)
+        power = spec.real * spec.real + spec.imag * spec.imag
+
+    # 功率谱密度缩放，单边谱除直流和奈奎斯特分量外乘2
+    power *= 1.0 / (fs * float(np.dot(win, win)))
+    if nperseg % 2:
+        power[:, 1:] *= 2
+    else:
+        power[:, 1:-1] *= 2
+
+    freqs = rfftfreq(nperseg, d=1.0 / fs)
+    bins = (nperseg / 2 + np.arange(power.shape[0]) * hop) / fs
+    return freqs, bins, power.T
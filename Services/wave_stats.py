@@ -0,0 +1,57 @@
+import numpy as np
+
+# numba为可选依赖，不可用时退回到NumPy实现
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _trace_stats_loop(y):
+    """
+    单次遍历计算波形的统计量
+
+    返回:
+    - mn: 最小值
+    - mx: 最大值
+    - mean: 均值
+    - var: 方差（总体方差）
+    - baseline: 前100个点的均值（基线）
+
+    均值和方差使用float64的Welford递推计算，避免带直流偏移的数据在
+    平方和减均值平方时损失精度
+    """
+    n = y.shape[0]
+    mn = y[0]
+    mx = y[0]
+    mean = 0.0
+    m2 = 0.0
+    baseline_total = 0.0
+    n_baseline = min(n, 100)
+    for i in range(n):
+        v = y[i]
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        delta = v - mean
+        mean += delta / (i + 1)
+        m2 += delta * (v - mean)
+        if i < n_baseline:
+            baseline_total += v
+    return mn, mx, mean, m2 / n, baseline_total / n_baseline
+
+
+def _trace_stats_numpy(y):
+    """NumPy版本的波形统计量计算，返回值与_trace_stats_loop一致"""
+    y = np.asarray(y)
+    y64 = y.astype(np.float64)
+    mean = y64.mean()
+    d = y64 - mean
+    return (y.min(), y.max(), mean, float(np.dot(d, d)) / y.shape[0], y64[:100].mean())
+
+
+if njit is not None:
+    trace_stats = njit(cache=True, fastmath=True)(_trace_stats_loop)
+else:
+    trace_stats = _trace_stats_numpy
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QToolBar, QDoubleSpinBox, QRadioButton, QButtonGroup, QFileDialog,
     QMessageBox, QSlider, QToolButton
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSlot, pyqtSignal, QTimer, QCoreApplication
+from PyQt6.QtCore import Qt, QSize, pyqtSlot, pyqtSignal, QTimer, QThread, QMetaObject, Q_ARG
 from PyQt6.QtGui import QIcon, QFont, QColor, QAction
 import time
 
@@ -36,6 +36,11 @@ class SourceDetectionWidget(QWidget):
         
         # 进度指示组件
         self.progress_bar = QProgressBar()
+        # 进度更新节流定时器，20毫秒内的多次进度更新合并为一次界面刷新
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._apply_progress)
         self.time_label = QLabel("预计时间: --:--")
         self.progress_label = QLabel("当前进度: 等待操作...")
         
@@ -983,17 +988,45 @@ class SourceDetectionWidget(QWidget):
         except:
             return 0
 
+    def _in_gui_thread(self):
+        """判断当前是否处于界面所在的线程"""
+        return QThread.currentThread() is self.thread()
+
+    @pyqtSlot(int)
     def set_progress(self, value):
-        """设置进度条值"""
+        """设置进度条值，从子线程调用时转交主线程执行"""
+        if not self._in_gui_thread():
+            QMetaObject.invokeMethod(self, "set_progress",
+                                     Qt.ConnectionType.QueuedConnection,
+                                     Q_ARG(int, int(value)))
+            return
+        self._discard_pending_progress()
         self.progress_bar.setValue(value)
         
+    @pyqtSlot(str)
     def update_status_text(self, text):
-        """更新状态文本"""
+        """更新状态文本，从子线程调用时转交主线程执行"""
+        if not self._in_gui_thread():
+            QMetaObject.invokeMethod(self, "update_status_text",
+                                     Qt.ConnectionType.QueuedConnection,
+                                     Q_ARG(str, text))
+            return
+        self._discard_pending_progress()
         self.progress_label.setText(text)
         
+    def _discard_pending_progress(self):
+        """
+        丢弃尚未刷新的进度信息，避免其覆盖直接设置的进度或状态文本
+        定时器只能在其所属的主线程中停止，调用方需保证在主线程中调用
+        """
+        self._pending_progress = None
+        self._progress_timer.stop()
+        
     def toggle_loading(self, is_loading=True):
         """切换加载状态"""
         if is_loading:
+            self._discard_pending_progress()
+            
             # 确保进度相关控件可见
             self.progress_bar.setVisible(True)
             self.time_label.setVisible(True)
@@ -1012,6 +1045,10 @@ class SourceDetectionWidget(QWidget):
             self.export_btn.setEnabled(False)
             self.reset_btn.setEnabled(False)
         else:
+            # 结束时先刷新尚未显示的进度，保证最后的100%不被丢弃
+            self._progress_timer.stop()
+            self._apply_progress()
+            
             # 计算完成后，隐藏进度相关控件，但保留速度标签
             self.progress_bar.setVisible(False)
             self.time_label.setVisible(False)
@@ -1040,7 +1077,20 @@ class SourceDetectionWidget(QWidget):
 
     @pyqtSlot(int, str, str, str)
     def update_progress(self, progress, elapsed_time, remaining_time_str, speed_str):
-        """更新进度显示"""
+        """
+        更新进度显示
+        只记录最新的进度信息，由节流定时器以不超过50Hz的频率刷新界面
+        """
+        self._pending_progress = (progress, elapsed_time, remaining_time_str, speed_str)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start(20)
+
+    def _apply_progress(self):
+        """将最近一次记录的进度信息刷新到界面"""
+        if self._pending_progress is None:
+            return
+        progress, elapsed_time, remaining_time_str, speed_str = self._pending_progress
+        self._pending_progress = None
         try:
             # 确保progress是整数
             progress = int(progress)
@@ -1078,24 +1128,6 @@ class SourceDetectionWidget(QWidget):
             self.progress_label.setText("当前进度: 计算中...")
             self.time_label.setText("时间信息: 计算中...")
             self.frontground_label.setText("处理速度: 计算中...")
-        
-        # 强制处理所有待处理的事件，确保UI更新
-        QCoreApplication.processEvents()
-        
-        # 如果进度条卡在某个值超过3秒，尝试重新绘制
-        if not hasattr(self, '_last_progress'):
-            self._last_progress = progress
-            self._progress_time = 0
-        elif self._last_progress == progress:
-            self._progress_time += 1
-            if self._progress_time > 30:  # 如果同一个进度超过30次更新(约3秒)
-                # 重置计数器
-                self._progress_time = 0
-                # 强制重绘进度条
-                self.progress_bar.repaint()
-        else:
-            self._last_progress = progress
-            self._progress_time = 0
 
     def display_heatmap_analysis(self, max_point, max_slice, grid_x, grid_y):
         """显示复杂的热力图分析结果"""
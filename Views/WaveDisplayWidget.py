@@ -1,28 +1,165 @@
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from mpl_toolkits.mplot3d import Axes3D  # 导入3D绘图工具
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLineEdit, QPushButton, QLabel, QGroupBox,
     QHBoxLayout, QComboBox, QSlider, QSplitter, QFrame, QSizePolicy,
     QToolButton, QGridLayout, QSpacerItem, QTabWidget, QCheckBox,
     QToolBar, QMenu, QSpinBox, QDoubleSpinBox, QRadioButton,
-    QButtonGroup, QFileDialog, QMessageBox
+    QButtonGroup, QFileDialog, QMessageBox, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QIcon, QFont, QColor, QPixmap, QAction
 from Services.ssatop import normalize_data
-import scipy.signal as signal
-import scipy.fft as fft
+from Models.Config import Config
+from Models.TaskRunner import TaskRunner
 import logging
+import os
 import traceback
 
 # 配置日志
 logger = logging.getLogger('WaveDisplayWidget')
 
+# pyqtgraph为可选依赖，可用时用于原始/归一化波形的快速绘制
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+# 超过该采样点数的波形使用加速的STFT实现计算时频图
+_ACCEL_STFT_MIN_SAMPLES = 2 ** 20
+
+# 超过该采样点数的波形，其频谱和时频图在后台线程中计算，避免阻塞界面
+_ASYNC_MIN_SAMPLES = 2 ** 18
+
+# 窗函数缓存，按(窗函数名称, 长度)保存，每种长度只生成一次
+_WIN_CACHE = {}
+
+
+def _install_fft_backend():
+    """
+    pyFFTW可用时将其设为scipy.fft的全局后端，并开启FFTW计划缓存
+    pyFFTW为可选依赖，不可用时保持scipy自带的pocketfft
+    """
+    try:
+        import pyfftw
+        from pyfftw.interfaces import scipy_fft
+    except ImportError:
+        return
+    
+    import scipy.fft
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    scipy.fft.set_global_backend(scipy_fft)
+    logger.info("使用pyFFTW作为FFT后端")
+
+
+def _get_window(name, n):
+    """获取指定名称和长度的窗函数（float32），优先使用缓存"""
+    key = (name, n)
+    window = _WIN_CACHE.get(key)
+    if window is None:
+        from scipy import signal
+        window = signal.get_window(name, n, fftbins=True).astype(np.float32)
+        _WIN_CACHE[key] = window
+    return window
+
+
+def _magnitude_spectrum(data, baseline, dt, scratch=None):
+    """
+    计算去基线、加汉宁窗后的单边幅度谱
+    
+    参数:
+    - data: 波形数据
+    - baseline: 基线值
+    - dt: 采样间隔，为None时不计算频率轴
+    - scratch: 可复用的float32缓冲区，为None时新建（后台线程中调用时不传）
+    
+    返回 (fft_data, freq_axis)
+    """
+    from scipy.fft import rfft, rfftfreq, next_fast_len
+    
+    n = data.size
+    if scratch is None:
+        scratch = np.empty(n, dtype=np.float32)
+    
+    # 先移除基线偏移
+    np.subtract(data, np.float32(baseline), out=scratch)
+    
+    # 应用窗函数减少频谱泄漏
+    np.multiply(scratch, _get_window('hann', n), out=scratch)
+    
+    # 补零到5-smooth长度，避免大素因子长度走慢速的Bluestein算法
+    nfft = next_fast_len(n, real=True)
+    
+    # 实数信号只需计算非冗余的一半频谱，workers=-1 使用全部核心
+    fft_data = np.abs(rfft(scratch, n=nfft, workers=-1))
+    freq_axis = rfftfreq(nfft, d=dt) if dt is not None else None
+    return fft_data, freq_axis
+
+
+def _smooth_len_below(n):
+    """返回不大于n的最大7-smooth长度（质因子只含2、3、5、7），FFT在此类长度上最快"""
+    for m in range(n, 0, -1):
+        k = m
+        for p in (2, 3, 5, 7):
+            while k % p == 0:
+                k //= p
+        if k == 1:
+            return m
+    return n
+
+
+def _spectrogram(data, sample_rate, nperseg, noverlap):
+    """计算时频图的功率谱密度，返回 (freqs, bins, Pxx)"""
+    from scipy import signal
+    from scipy.fft import set_workers
+    from Services import stft_accel
+    
+    if len(data) > _ACCEL_STFT_MIN_SAMPLES:
+        # 超长波形使用jax/numba加速的STFT
+        return stft_accel.spectrogram(data, sample_rate, nperseg, noverlap)
+    
+    # 分段FFT由pocketfft在C层完成，set_workers使其并行计算
+    with set_workers(-1):
+        return signal.spectrogram(data.astype(np.float32, copy=False),
+                                  fs=sample_rate, window='hann',
+                                  nperseg=nperseg, noverlap=noverlap, detrend=False,
+                                  scaling='density', mode='psd')
+
+
+def _minmax_downsample(t, y, n_out):
+    """
+    按最小/最大值抽稀波形，用于绘图
+    将数据分为n_out段，每段保留最小值和最大值两个点（按时间先后排列），
+    屏幕像素级别下与原始波形外观一致，但绘制的顶点数最多为2*n_out
+    """
+    n = len(y)
+    if n_out <= 0 or n <= 2 * n_out:
+        return t, y
+    
+    chunk = n // n_out
+    m = chunk * n_out
+    t_chunks = t[:m].reshape(n_out, chunk)
+    y_chunks = y[:m].reshape(n_out, chunk)
+    
+    # 每段的最小、最大值位置，按时间先后交错排列
+    idx_min = y_chunks.argmin(axis=1)
+    idx_max = y_chunks.argmax(axis=1)
+    first = np.minimum(idx_min, idx_max)
+    second = np.maximum(idx_min, idx_max)
+    rows = np.arange(n_out)
+    
+    t_out = np.stack((t_chunks[rows, first], t_chunks[rows, second]), axis=1).ravel()
+    y_out = np.stack((y_chunks[rows, first], y_chunks[rows, second]), axis=1).ravel()
+    
+    # 末尾不足一段的数据原样保留
+    return np.concatenate((t_out, t[m:])), np.concatenate((y_out, y[m:]))
+
+
 # 自定义NavigationToolbar，修复在PyQt6中的保存功能
 class CustomNavigationToolbar(NavigationToolbar):
     """
@@ -39,9 +176,105 @@ class CustomNavigationToolbar(NavigationToolbar):
 
 
 class WaveDisplayWidget(QWidget):
+    # 主频搜索的频率上限（Hz），微地震信号的有效能量集中在该频带内
+    _DOMINANT_FREQ_MAX = 500.0
+    
+    # 频谱分析窗口类型与scipy窗函数名称的对应关系
+    _WINDOW_NAMES = {
+        "矩形窗": 'boxcar',
+        "汉宁窗": 'hann',
+        "汉明窗": 'hamming',
+        "布莱克曼窗": 'blackman',
+        "平顶窗": 'flattop'
+    }
+    
+    # 滤波类型与巴特沃斯滤波器类型的对应关系，其余类型为中值滤波
+    _BUTTER_TYPES = {
+        "低通": 'low',
+        "高通": 'high',
+        "带通": 'band',
+        "带阻": 'bandstop'
+    }
+    
+    # 波数据详情表格模板，加载数据时通过format_map填充
+    _HTML_TMPL = (
+        "<div style='padding:10px; border:1px solid #ddd; border-radius:5px; background-color:#f8f9fa;'>"
+        "<h3 style='text-align:center; color:#0D47A1; margin-top:0;'>波数据详情</h3>"
+        # 使用单一大表格呈现所有信息
+        "<table style='width:100%; border-collapse:collapse; margin-bottom:10px; border:1px solid #ddd;'>"
+        # 表头
+        "<thead style='background-color:#0D47A1; color:white;'>"
+        "<tr>"
+        "<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>参数</th>"
+        "<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>数值</th>"
+        "<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>参数</th>"
+        "<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>数值</th>"
+        "</tr>"
+        "</thead>"
+        # 表格主体
+        "<tbody>"
+        # 第一行 - 基本信息
+        "<tr style='background-color:#e3f2fd;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>通道编号</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{trace_number}</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>数据点数</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{n_points:,}</td>"
+        "</tr>"
+        # 第二行 - 采样信息
+        "<tr style='background-color:#f5f5f5;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>采样间隔</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{sample_interval:.6f} s</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>采样频率</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{sample_rate:.2f} Hz</td>"
+        "</tr>"
+        # 第三行 - 记录信息
+        "<tr style='background-color:#e3f2fd;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>记录总时长</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{duration:.3f} s</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>主频率</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{dominant_freq} Hz</td>"
+        "</tr>"
+        # 第四行 - 事件信息
+        "<tr style='background-color:#f5f5f5;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>事件区间</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{event_start:.3f} ~ {event_end:.3f} s</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>事件持续</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{event_duration:.3f} s</td>"
+        "</tr>"
+        # 第五行 - 统计信息1
+        "<tr style='background-color:#e3f2fd;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>最大值</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{data_max:.4f}</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>最小值</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{data_min:.4f}</td>"
+        "</tr>"
+        # 第六行 - 统计信息2
+        "<tr style='background-color:#f5f5f5;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>均值</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{data_mean:.4f}</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>标准差</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{data_std:.4f}</td>"
+        "</tr>"
+        # 第七行 - 统计信息3
+        "<tr style='background-color:#e3f2fd;'>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>有效值(RMS)</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{data_rms:.4f}</td>"
+        "<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>信噪比(SNR)</td>"
+        "<td style='padding:8px; border:1px solid #ddd;'>{snr:.2f}</td>"
+        "</tr>"
+        "</tbody>"
+        "</table>"
+        # 操作提示
+        "<div style='padding:8px; background-color:#fffde7; border-radius:3px; border:1px solid #ffd54f; margin-top:10px;'>"
+        "<p style='margin:0; font-size:0.9em;'><b>提示</b>: 选择<b>原始波形</b>查看实际振幅 | 选择<b>归一化波形</b>查看标准化信号 | 使用<b>缩放滑块</b>调整视图</p>"
+        "</div>"
+        "</div>"
+    )
+
     def __init__(self):
         super().__init__()
         logger.info("初始化WaveDisplayWidget")
+        _install_fft_backend()
         
         # 定义组件
         self.init_components()
@@ -54,6 +287,70 @@ class WaveDisplayWidget(QWidget):
         self.fft_data = None
         self.time_axis = None
         self.freq_axis = None
+        self._dt_cache = None
+        self._is_uniform_grid = False
+        # 频谱与时频图计算结果缓存，切换显示类型时只重绘不重算
+        self._fft_cache = {}
+        self._specgram_cache = {}
+        self._welch_cache = {}
+        self._butter_cache = {}  # 滤波器系数缓存，与数据无关，加载新数据时保留
+        self._baseline = 0.0
+        self._fft_scratch = None  # compute_fft的去基线/加窗缓冲区
+        self._phase_buf = None  # 相位谱的去基线/加窗缓冲区
+        # blit用的背景缓存（不含被重绘的坐标轴），按画布保存
+        self._blit_bgs = {}
+        # 波形与频谱共用的坐标轴和曲线，切换显示类型时只更新数据
+        self._ax = None
+        self._line = None
+        # 时频图坐标轴、网格图像和颜色条，重绘时图像替换、颜色条复用
+        self._spec_ax = None
+        self._mesh = None
+        self._cbar = None
+        # 频谱分析页的坐标轴和曲线，首次显示频谱时创建
+        self._spectrum_ax = None
+        self._spec_last_key = None  # 上次绘制频谱时的数据和参数
+        # 滤波结果页的坐标轴，首次滤波时创建
+        self._tf_axes = None
+        # 模拟波形的正弦分量和噪声生成器，首次点击显示按钮时创建
+        self._sim_wave = None
+        self._rng = None
+        # 后台计算任务：运行中的线程，以及正在计算的频谱/时频图的缓存键
+        self._tasks = set()
+        self._fft_pending = None
+        self._specgram_pending = None
+        self._detail_vals = None
+
+    @property
+    def _loaded(self):
+        """是否已加载可分析的波数据（时间轴至少包含两个采样点）"""
+        return self.time_axis is not None and len(self.time_axis) >= 2
+
+    @property
+    def current_data(self):
+        """当前显示的波形数据，统一保存为连续的float32数组"""
+        return self._current_data
+
+    @current_data.setter
+    def current_data(self, value):
+        self._current_data = None if value is None else np.ascontiguousarray(value, dtype=np.float32)
+
+    @property
+    def normalized_data(self):
+        """归一化波形，首次访问时由当前波形计算并缓存，加载新数据时失效"""
+        if self._normalized_data is None and self.current_data is not None:
+            self._normalized_data = normalize_data(self.current_data)
+        return self._normalized_data
+
+    @normalized_data.setter
+    def normalized_data(self, value):
+        self._normalized_data = value
+
+    @property
+    def _dt(self):
+        """采样间隔，首次访问时由时间轴计算并缓存，加载新数据时失效"""
+        if self._dt_cache is None:
+            self._dt_cache = float(self.time_axis[1] - self.time_axis[0])
+        return self._dt_cache
 
     def init_components(self):
         # 控制面板组件
@@ -65,10 +362,32 @@ class WaveDisplayWidget(QWidget):
         self.fig = Figure(figsize=(8, 5), dpi=100)  # 更大的画布
         self.canvas = FigureCanvas(self.fig)
         self.canvas.setMinimumHeight(300)
+        # 画布尺寸变化后blit背景失效
+        self.canvas.mpl_connect(
+            'resize_event', lambda event: self._invalidate_blit_background(self.canvas))
         
         # 添加自定义matplotlib导航工具栏
         self.toolbar = CustomNavigationToolbar(self.canvas, self)
         
+        # 波形绘图区：pyqtgraph可用时原始/归一化波形使用PlotWidget，其余显示类型使用matplotlib画布
+        self.plot_stack = QStackedWidget()
+        self.plot_stack.addWidget(self.canvas)
+        self.pg_plot = None
+        self.pg_curve = None
+        if pg is not None:
+            # 开启GPU加速时使用OpenGL绘制百万点级别的波形
+            if Config().get("Advanced", "use_gpu") == "True":
+                pg.setConfigOption('useOpenGL', True)
+            self.pg_plot = pg.PlotWidget()
+            self.pg_plot.setBackground('w')
+            self.pg_plot.setMinimumHeight(300)
+            self.pg_legend = self.pg_plot.addLegend()
+            self.pg_curve = self.pg_plot.plot(pen='b', name='原始波形')
+            # 按峰值自动抽稀并只绘制可见范围内的数据
+            self.pg_curve.setDownsampling(auto=True, method='peak')
+            self.pg_curve.setClipToView(True)
+            self.plot_stack.addWidget(self.pg_plot)
+        
         # 波形控制组件
         self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
         self.zoom_label = QLabel("缩放: 100%")
@@ -130,6 +449,8 @@ class WaveDisplayWidget(QWidget):
         # 频谱分析画布
         self.spectrum_fig = Figure(figsize=(8, 5), dpi=100)
         self.spectrum_canvas = FigureCanvas(self.spectrum_fig)
+        self.spectrum_canvas.mpl_connect(
+            'resize_event', lambda event: self._invalidate_blit_background(self.spectrum_canvas))
         self.spectrum_toolbar = CustomNavigationToolbar(self.spectrum_canvas, self)
         
         # 高级分析画布
@@ -156,6 +477,17 @@ class WaveDisplayWidget(QWidget):
         self.cutoff_spin.setValue(50)
         
         self.apply_filter_btn = QPushButton("应用滤波")
+        
+        # 滤波参数变化的防抖定时器，连续调整时只在最后一次变化后重新滤波
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(lambda: self._apply_filter(interactive=False))
+        self._filter_applied = False
+        
+        # 缩放滑块的防抖定时器，拖动过程中的连续变化合并为一次重绘
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self.apply_pending_zoom)
 
     def init_ui(self):
         # 设置整体样式
@@ -320,7 +652,8 @@ class WaveDisplayWidget(QWidget):
 
         # 连接信号和槽
         self.display_button.clicked.connect(self.on_display_button_clicked)
-        self.zoom_slider.valueChanged.connect(self.update_zoom)
+        self.zoom_slider.valueChanged.connect(self.schedule_zoom)
+        self.zoom_slider.sliderReleased.connect(self.apply_pending_zoom)
         self.grid_checkbox.stateChanged.connect(self.update_display_options)
         self.legend_checkbox.stateChanged.connect(self.update_display_options)
         self.display_type_group.buttonClicked.connect(self.update_display_type)
@@ -384,7 +717,7 @@ class WaveDisplayWidget(QWidget):
         # 添加图表和工具栏
         display_layout.addLayout(tools_layout)
         display_layout.addWidget(self.toolbar)
-        display_layout.addWidget(self.canvas)
+        display_layout.addWidget(self.plot_stack)
         display_layout.addWidget(self.display_label)
         
         display_group.setLayout(display_layout)
@@ -531,6 +864,10 @@ class WaveDisplayWidget(QWidget):
         
         # 连接信号
         self.apply_filter_btn.clicked.connect(self.apply_filter)
+        self.cutoff_spin.valueChanged.connect(self.schedule_filter)
+        self.start_time_spin.valueChanged.connect(self.schedule_filter)
+        self.end_time_spin.valueChanged.connect(self.schedule_filter)
+        self.filter_combo.currentIndexChanged.connect(self.schedule_filter)
         
         tab.setLayout(layout)
         return tab
@@ -539,278 +876,504 @@ class WaveDisplayWidget(QWidget):
         """
         显示波数据及归一化后的波形图
         """
-        # 保存数据
-        self.current_data = wave_data
-        self.normalized_data = normalize_data(wave_data)
-        self.time_axis = np.arange(sample_count) * sample_interval
-        self.current_trace_number = trace_number  # 保存当前道号
-        
-        # 计算频谱
-        self.compute_fft()
-        
-        # 计算波形的统计特性
-        data_max = np.max(wave_data)
-        data_min = np.min(wave_data)
-        data_mean = np.mean(wave_data)
-        data_std = np.std(wave_data)
-        data_rms = np.sqrt(np.mean(np.square(wave_data)))
-        
-        # 计算主频率 - 使用功率谱的峰值频率
-        if self.freq_axis is not None and self.fft_data is not None:
-            peak_freq_idx = np.argmax(self.fft_data[5:]) + 5  # 跳过最低频
-            dominant_freq = self.freq_axis[peak_freq_idx]
-        else:
-            dominant_freq = 0
-            
-        # 估算信噪比 - 使用峰值与标准差的比值
-        snr = 0
-        if data_std > 0:
-            snr = 20 * np.log10(data_max / data_std)
-            
-        # 清除现有图表
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
-        
-        # 显示波数据详情 - 使用标准表格布局
-        self.display_label.setText(
-            f"<div style='padding:10px; border:1px solid #ddd; border-radius:5px; background-color:#f8f9fa;'>"
-            f"<h3 style='text-align:center; color:#0D47A1; margin-top:0;'>波数据详情</h3>"
-            
-            # 使用单一大表格呈现所有信息
-            f"<table style='width:100%; border-collapse:collapse; margin-bottom:10px; border:1px solid #ddd;'>"
-            
-            # 表头
-            f"<thead style='background-color:#0D47A1; color:white;'>"
-            f"<tr>"
-            f"<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>参数</th>"
-            f"<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>数值</th>"
-            f"<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>参数</th>"
-            f"<th style='padding:8px; text-align:left; border:1px solid #ddd; width:25%;'>数值</th>"
-            f"</tr>"
-            f"</thead>"
-            
-            # 表格主体
-            f"<tbody>"
-            
-            # 第一行 - 基本信息
-            f"<tr style='background-color:#e3f2fd;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>通道编号</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{trace_number}</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>数据点数</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{len(wave_data):,}</td>"
-            f"</tr>"
-            
-            # 第二行 - 采样信息
-            f"<tr style='background-color:#f5f5f5;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>采样间隔</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{sample_interval:.6f} s</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>采样频率</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{1/sample_interval:.2f} Hz</td>"
-            f"</tr>"
-            
-            # 第三行 - 记录信息
-            f"<tr style='background-color:#e3f2fd;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>记录总时长</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{sample_count * sample_interval:.3f} s</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>主频率</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{dominant_freq:.2f} Hz</td>"
-            f"</tr>"
-            
-            # 第四行 - 事件信息
-            f"<tr style='background-color:#f5f5f5;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>事件区间</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{time_data['start']:.3f} ~ {time_data['end']:.3f} s</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>事件持续</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{time_data['end']-time_data['start']:.3f} s</td>"
-            f"</tr>"
-            
-            # 第五行 - 统计信息1
-            f"<tr style='background-color:#e3f2fd;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>最大值</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{data_max:.4f}</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>最小值</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{data_min:.4f}</td>"
-            f"</tr>"
-            
-            # 第六行 - 统计信息2
-            f"<tr style='background-color:#f5f5f5;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>均值</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{data_mean:.4f}</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>标准差</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{data_std:.4f}</td>"
-            f"</tr>"
-            
-            # 第七行 - 统计信息3
-            f"<tr style='background-color:#e3f2fd;'>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>有效值(RMS)</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{data_rms:.4f}</td>"
-            f"<td style='padding:8px; border:1px solid #ddd; font-weight:bold;'>信噪比(SNR)</td>"
-            f"<td style='padding:8px; border:1px solid #ddd;'>{snr:.2f}</td>"
-            f"</tr>"
-            
-            f"</tbody>"
-            f"</table>"
-            
-            # 操作提示
-            f"<div style='padding:8px; background-color:#fffde7; border-radius:3px; border:1px solid #ffd54f; margin-top:10px;'>"
-            f"<p style='margin:0; font-size:0.9em;'><b>提示</b>: 选择<b>原始波形</b>查看实际振幅 | 选择<b>归一化波形</b>查看标准化信号 | 使用<b>缩放滑块</b>调整视图</p>"
-            f"</div>"
-            
-            f"</div>"
-        )
+        # 暂停整个控件的重绘，所有子控件更新完成后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            # 保存数据，统一为连续的float32数组以减半后续统计、加窗和FFT的内存带宽
+            wave_data = np.ascontiguousarray(wave_data, dtype=np.float32)
+            self.current_data = wave_data
+            self.normalized_data = None  # 首次显示归一化波形时再计算
+            self.time_axis = np.arange(sample_count) * sample_interval
+            self._dt_cache = None
+            self._is_uniform_grid = True  # 由等间隔采样生成的时间轴
+            self._fft_cache.clear()
+            self._specgram_cache.clear()
+            self._welch_cache.clear()
+            self._spec_last_key = None
+            self.current_trace_number = trace_number  # 保存当前道号
 
-        # 更新时间范围控件
-        max_time = sample_count * sample_interval
-        logger.info(f"更新时间范围: 0 - {max_time} s")
-        
-        # 设置起始和结束时间的范围
-        self.start_time_spin.setRange(0, max_time)
-        self.end_time_spin.setRange(0, max_time)
-        
-        # 设置默认值为微地震预测发生区间，如果存在
-        if time_data and 'start' in time_data and 'end' in time_data:
-            # 扩展一点时间范围，前后各增加10%的事件持续时间
-            event_duration = time_data['end'] - time_data['start']
-            buffer = max(0.1 * event_duration, 0.1)  # 至少0.1秒缓冲
-            
-            start_time = max(0, time_data['start'] - buffer)
-            end_time = min(max_time, time_data['end'] + buffer)
-            
-            self.start_time_spin.setValue(start_time)
-            self.end_time_spin.setValue(end_time)
-        else:
-            # 如果没有事件信息，则显示前5秒或全部
-            self.start_time_spin.setValue(0)
-            self.end_time_spin.setValue(min(5, max_time))
-        
-        # 更新步长为总时长的1%，方便微调
-        step_size = max(0.01, max_time / 100)
-        self.start_time_spin.setSingleStep(step_size)
-        self.end_time_spin.setSingleStep(step_size)
+            # 单次遍历计算波形的统计特性，基线供频谱计算复用
+            from Services.wave_stats import trace_stats
+            data_min, data_max, data_mean, data_var, self._baseline = trace_stats(wave_data)
+            n_points = len(wave_data)
+            data_std = np.sqrt(data_var)
+            data_rms = np.sqrt(data_var + data_mean * data_mean)
 
-        # 更新显示
-        self.update_display_type()
+            # 计算频谱，长波形在后台计算，完成后再补充主频
+            self.compute_fft(background=True)
+
+            # 估算信噪比 - 使用峰值与标准差的比值
+            snr = 0
+            if data_std > 0:
+                snr = 20 * np.log10(data_max / data_std)
+
+            # 图表在update_display_type中统一重绘
+            self._invalidate_blit_background()
+
+            # 显示波数据详情 - 使用预定义的表格模板
+            vals = {
+                'trace_number': trace_number,
+                'n_points': n_points,
+                'sample_interval': sample_interval,
+                'sample_rate': 1 / sample_interval,
+                'duration': sample_count * sample_interval,
+                'dominant_freq': self._format_dominant_freq(),
+                'event_start': time_data['start'],
+                'event_end': time_data['end'],
+                'event_duration': time_data['end'] - time_data['start'],
+                'data_max': data_max,
+                'data_min': data_min,
+                'data_mean': data_mean,
+                'data_std': data_std,
+                'data_rms': data_rms,
+                'snr': snr,
+            }
+            # 暂停标签重绘，合并富文本解析后的多次刷新
+            self._detail_vals = vals
+            self.display_label.setUpdatesEnabled(False)
+            self.display_label.setText(self._HTML_TMPL.format_map(vals))
+            self.display_label.setUpdatesEnabled(True)
+
+            # 更新时间范围控件
+            max_time = sample_count * sample_interval
+            logger.info("更新时间范围: 0 - %s s", max_time)
+
+            # 程序化设置控件时屏蔽valueChanged信号，避免级联触发
+            with QSignalBlocker(self.start_time_spin), QSignalBlocker(self.end_time_spin):
+                # 设置起始和结束时间的范围
+                self.start_time_spin.setRange(0, max_time)
+                self.end_time_spin.setRange(0, max_time)
+
+                # 设置默认值为微地震预测发生区间，如果存在
+                if time_data and 'start' in time_data and 'end' in time_data:
+                    # 扩展一点时间范围，前后各增加10%的事件持续时间
+                    event_duration = time_data['end'] - time_data['start']
+                    buffer = max(0.1 * event_duration, 0.1)  # 至少0.1秒缓冲
+
+                    start_time = max(0, time_data['start'] - buffer)
+                    end_time = min(max_time, time_data['end'] + buffer)
+
+                    self.start_time_spin.setValue(start_time)
+                    self.end_time_spin.setValue(end_time)
+                else:
+                    # 如果没有事件信息，则显示前5秒或全部
+                    self.start_time_spin.setValue(0)
+                    self.end_time_spin.setValue(min(5, max_time))
+
+                # 更新步长为总时长的1%，方便微调
+                step_size = max(0.01, max_time / 100)
+                self.start_time_spin.setSingleStep(step_size)
+                self.end_time_spin.setSingleStep(step_size)
+
+            # 更新显示
+            self.update_display_type()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
         
-    def compute_fft(self):
-        """计算频谱"""
-        if self.current_data is None:
+    def _format_dominant_freq(self):
+        """
+        计算主频率（功率谱的峰值频率）并格式化为详情表格中的文本
+        频谱仍在后台计算时返回提示文本
+        """
+        if self.fft_data is None and self._fft_pending is not None:
+            return "计算中..."
+        if self.freq_axis is None or self.fft_data is None:
+            return f"{0:.2f}"
+        
+        # 只在微地震有效频带内搜索，排除高频混叠造成的伪峰值
+        band_hi_idx = int(np.searchsorted(self.freq_axis, self._DOMINANT_FREQ_MAX))
+        if band_hi_idx <= 5:
+            band_hi_idx = len(self.fft_data)
+        peak_freq_idx = 5 + int(np.argmax(self.fft_data[5:band_hi_idx]))  # 跳过最低频
+        return f"{self.freq_axis[peak_freq_idx]:.2f}"
+    
+    def _run_in_background(self, func, callback):
+        """在TaskRunner线程中执行func，完成后在界面线程中以返回值调用callback"""
+        runner = TaskRunner(func)
+        runner.task_completed.connect(callback)
+        runner.finished.connect(lambda: self._tasks.discard(runner))
+        # 持有线程引用直到运行结束，避免线程对象被提前回收
+        self._tasks.add(runner)
+        runner.start()
+    
+    def compute_fft(self, background=False):
+        """
+        计算频谱
+        
+        background为True且波形较长时在后台线程中计算，
+        计算期间fft_data为None，完成后由_on_fft_ready更新
+        """
+        data = self.current_data
+        if data is None:
             return
-            
-        # 计算FFT
-        n = len(self.current_data)
         
-        # 先移除基线偏移
-        baseline = np.mean(self.current_data[:100])
-        data_centered = self.current_data - baseline
+        n = data.size
+        dt = self._dt if self._loaded else None
         
-        # 应用窗函数减少频谱泄漏
-        window = np.hanning(n)
-        windowed_data = data_centered * window
+        # 命中缓存时直接复用已计算的频谱
+        fft_cache = self._fft_cache
+        cache_key = (data.ctypes.data, n, 'hann')
+        cached = fft_cache.get(cache_key)
+        if cached is not None:
+            self.fft_data, self.freq_axis = cached
+            return
+        
+        if background and n >= _ASYNC_MIN_SAMPLES:
+            self.fft_data = None
+            if self._fft_pending != cache_key:
+                self._fft_pending = cache_key
+                baseline = self._baseline
+                self._run_in_background(
+                    lambda: (cache_key, data, _magnitude_spectrum(data, baseline, dt)),
+                    self._on_fft_ready
+                )
+            return
         
-        # 计算FFT
-        self.fft_data = np.abs(fft.fft(windowed_data))
-        self.fft_data = self.fft_data[:n//2]  # 只取一半（实数信号的频谱是对称的）
+        # 去基线和加窗都写入复用的缓冲区，长度变化时才重新分配
+        scratch = self._fft_scratch
+        if scratch is None or scratch.size != n:
+            scratch = self._fft_scratch = np.empty(n, dtype=np.float32)
         
-        # 计算频率轴
-        if self.time_axis is not None:
-            sample_rate = 1 / (self.time_axis[1] - self.time_axis[0])
-            self.freq_axis = np.linspace(0, sample_rate/2, n//2)
+        fft_data, freq_axis = _magnitude_spectrum(data, self._baseline, dt, scratch)
+        self.fft_data = fft_data
+        if freq_axis is not None:
+            self.freq_axis = freq_axis
+            fft_cache[cache_key] = (fft_data, freq_axis)
+    
+    def _on_fft_ready(self, result):
+        """后台频谱计算完成，更新主频和频谱图"""
+        if isinstance(result, Exception):
+            logger.error("后台计算频谱失败: %s", result)
+            self._fft_pending = None
+            return
+        
+        cache_key, data, (fft_data, freq_axis) = result
+        if cache_key == self._fft_pending:
+            self._fft_pending = None
+        # 计算期间已切换到其他波形时丢弃结果
+        if data is not self.current_data:
+            return
+        
+        self.fft_data = fft_data
+        if freq_axis is not None:
+            self.freq_axis = freq_axis
+            self._fft_cache[cache_key] = (fft_data, freq_axis)
+        
+        if self._detail_vals is not None:
+            self._detail_vals['dominant_freq'] = self._format_dominant_freq()
+            self.display_label.setText(self._HTML_TMPL.format_map(self._detail_vals))
+        if self.fft_radio.isChecked():
+            self.update_display_type()
+    
+    def compute_spectrogram(self, sample_rate, nperseg=256, noverlap=128, background=False):
+        """
+        计算时频图的功率谱密度，结果按数据和分段参数缓存
+        
+        background为True且波形较长时在后台线程中计算并返回None，
+        完成后由_on_specgram_ready重绘
+        
+        返回:
+        - freqs: 频率轴
+        - bins: 各分段的中心时间
+        - Pxx: 功率谱密度矩阵
+        """
+        data = self.current_data
+        cache_key = (data.ctypes.data, len(data), nperseg, noverlap)
+        cached = self._specgram_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if background and len(data) >= _ASYNC_MIN_SAMPLES:
+            if self._specgram_pending != cache_key:
+                self._specgram_pending = cache_key
+                self._run_in_background(
+                    lambda: (cache_key, data, _spectrogram(data, sample_rate, nperseg, noverlap)),
+                    self._on_specgram_ready
+                )
+            return None
+        
+        cached = _spectrogram(data, sample_rate, nperseg, noverlap)
+        self._specgram_cache[cache_key] = cached
+        return cached
+    
+    def _on_specgram_ready(self, result):
+        """后台时频图计算完成，写入缓存并重绘"""
+        if isinstance(result, Exception):
+            logger.error("后台计算时频图失败: %s", result)
+            self._specgram_pending = None
+            return
+        
+        cache_key, data, value = result
+        if cache_key == self._specgram_pending:
+            self._specgram_pending = None
+        # 计算期间已切换到其他波形时丢弃结果
+        if data is not self.current_data:
+            return
+        
+        self._specgram_cache[cache_key] = value
+        if self.spectrogram_radio.isChecked():
+            self.update_display_type()
+    
+    def is_trace_plot_active(self):
+        """当前是否由pyqtgraph绘制原始/归一化波形"""
+        return (self.pg_plot is not None
+                and (self.raw_radio.isChecked() or self.normalized_radio.isChecked()))
+    
+    def update_trace_plot(self):
+        """使用pyqtgraph绘制原始或归一化波形，只更新曲线数据而不重建图表"""
+        if self.raw_radio.isChecked():
+            name, data, pen = '原始波形', self.current_data, 'b'
+            self.pg_plot.setTitle('原始波形数据')
+            self.pg_plot.setLabel('left', '振幅')
+        else:
+            name, data, pen = '归一化波形', self.normalized_data, 'g'
+            self.pg_plot.setTitle('归一化波形数据')
+            self.pg_plot.setLabel('left', '归一化振幅')
+        self.pg_plot.setLabel('bottom', '时间 (s)')
+        
+        self.pg_curve.setPen(pen)
+        self.pg_curve.setData(self.time_axis, data)
+        self.pg_legend.removeItem(self.pg_curve)
+        self.pg_legend.addItem(self.pg_curve, name)
+        
+        if self.raw_radio.isChecked():
+            # 使用原始数据的实际振幅范围
+            self.pg_plot.enableAutoRange()
+        else:
+            self.pg_plot.enableAutoRange(axis='x')
+            self.pg_plot.setYRange(-1.1, 1.1, padding=0)
+        
+        self.plot_stack.setCurrentWidget(self.pg_plot)
+        self.toolbar.setVisible(False)
+        self.update_display_options()
+    
+    def export_figure(self, file_path, **savefig_kwargs):
+        """
+        将当前显示的波形图保存到文件
+        pyqtgraph绘制的波形先按导出分辨率绘制到matplotlib图表中，保证dpi、背景色等参数生效
+        """
+        if self.is_trace_plot_active():
+            dpi = savefig_kwargs.get('dpi') or self.fig.get_dpi()
+            self._invalidate_blit_background()
+            self._draw_trace_matplotlib(int(self.fig.get_figwidth() * dpi))
+            
+            # 与pyqtgraph当前的显示范围、网格和图例保持一致
+            ax = self._ax
+            (x0, x1), (y0, y1) = self.pg_plot.viewRange()
+            ax.set_xlim(x0, x1)
+            ax.set_ylim(y0, y1)
+            ax.grid(self.grid_checkbox.isChecked())
+            if self.legend_checkbox.isChecked():
+                ax.legend()
+            elif ax.get_legend():
+                ax.get_legend().remove()
+        self.fig.savefig(file_path, **savefig_kwargs)
     
     def update_display_type(self):
         """根据选择的显示类型更新图表"""
         if self.current_data is None:
             return
+        
+        # 原始/归一化波形优先交给pyqtgraph绘制
+        if self.is_trace_plot_active():
+            self.update_trace_plot()
+            return
+        self.plot_stack.setCurrentWidget(self.canvas)
+        self.toolbar.setVisible(True)
             
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
+        self._invalidate_blit_background()
+        
+        # 波形按画布宽度抽稀，避免提交远超像素数的顶点
+        n_out = int(self.canvas.get_width_height()[0])
         
         # 根据选择的显示类型绘制不同的图
-        if self.raw_radio.isChecked():
-            # 原始波形
-            ax.plot(self.time_axis, self.current_data, 'b-', label='原始波形')
-            ax.set_title('原始波形数据')
-            ax.set_xlabel('时间 (s)')
-            ax.set_ylabel('振幅')
-            # 重要：使用原始数据的实际振幅范围，不进行归一化
-            ax.relim()  # 重新计算限制
-            ax.autoscale()  # 自动缩放到实际数据范围
-            
-        elif self.normalized_radio.isChecked():
-            # 归一化波形
-            ax.plot(self.time_axis, self.normalized_data, 'g-', label='归一化波形')
-            ax.set_title('归一化波形数据')
-            ax.set_xlabel('时间 (s)')
-            ax.set_ylabel('归一化振幅')
-            # 归一化的情况下，明确设置Y轴范围为[-1.1, 1.1]，略大于标准化后的[-1, 1]范围
-            ax.set_ylim(-1.1, 1.1)
+        if self.raw_radio.isChecked() or self.normalized_radio.isChecked():
+            self._draw_trace_matplotlib(n_out)
             
         elif self.fft_radio.isChecked():
             # 频谱分析
+            ax = self._line_axes()
             if self.freq_axis is not None and self.fft_data is not None:
                 # 排除频谱中前5%的低频分量，避免直流分量和极低频噪声影响显示效果
                 start_idx = max(1, int(len(self.fft_data) * 0.01))
-                ax.plot(self.freq_axis[start_idx:], self.fft_data[start_idx:], 'r-', label='频谱')
+                self._set_line(self.freq_axis[start_idx:], self.fft_data[start_idx:], 'r', '频谱')
                 ax.set_title('频谱分析')
                 ax.set_xlabel('频率 (Hz)')
                 ax.set_ylabel('幅度')
                 ax.set_xlim(0, min(500, max(self.freq_axis)))  # 限制显示范围
                 ax.relim()
                 ax.autoscale(axis='y')  # 只对Y轴自动缩放
+            else:
+                self._line.set_data([], [])
                 
         elif self.spectrogram_radio.isChecked():
             # 时频图
-            if self.current_data is not None and self.time_axis is not None:
+            ax = self._spectrogram_axes()
+            if self.current_data is not None and self._loaded:
                 # 计算并绘制时频图，丢弃前0.5%的功率以避免过强信号压缩显示比例
-                sample_rate = 1 / (self.time_axis[1] - self.time_axis[0])
-                # 增加vmin参数，设置最小阈值，忽略过大幅度
-                Pxx, freqs, bins, im = ax.specgram(self.current_data, NFFT=256, Fs=sample_rate, 
-                           noverlap=128, cmap='viridis', 
-                           vmin=None, scale='dB')  # scale='dB'使用分贝刻度，降低动态范围差异
-                ax.set_title('时频分析')
-                ax.set_xlabel('时间 (s)')
-                ax.set_ylabel('频率 (Hz)')
-                ax.set_ylim(0, min(500, sample_rate/2))  # 限制频率显示范围
-                self.fig.colorbar(im, ax=ax, label='功率/频率 (dB/Hz)')
+                sample_rate = 1 / self._dt
+                result = self.compute_spectrogram(sample_rate, background=True)
+                # 网格尺寸随数据变化，移除旧图像并重新计算坐标范围
+                if self._mesh is not None:
+                    self._mesh.remove()
+                    self._mesh = None
+                    ax.ignore_existing_data_limits = True
+                if result is None:
+                    # 长波形的时频图在后台计算，完成后自动重绘
+                    ax.set_title('时频分析（计算中...）')
+                else:
+                    freqs, bins, Pxx = result
+                    # 使用分贝刻度，降低动态范围差异
+                    im = ax.pcolormesh(bins, freqs, 10 * np.log10(Pxx + 1e-12),
+                                       shading='auto', cmap='viridis')
+                    self._mesh = im
+                    ax.set_title('时频分析')
+                    ax.set_xlabel('时间 (s)')
+                    ax.set_ylabel('频率 (Hz)')
+                    ax.set_ylim(0, min(500, sample_rate/2))  # 限制频率显示范围
+                    # 颜色条只创建一次，之后切换到新图像的色彩映射
+                    if self._cbar is None:
+                        self._cbar = self.fig.colorbar(im, ax=ax, label='功率/频率 (dB/Hz)')
+                    else:
+                        self._cbar.update_normal(im)
         
         # 更新显示选项
         self.update_display_options()
         
         # 绘制图表
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def _draw_trace_matplotlib(self, n_out):
+        """用matplotlib绘制原始或归一化波形，波形按n_out个水平像素抽稀"""
+        ax = self._line_axes()
+        if self.raw_radio.isChecked():
+            # 原始波形
+            t_plot, y_plot = _minmax_downsample(self.time_axis, self.current_data, n_out)
+            self._set_line(t_plot, y_plot, 'b', '原始波形')
+            ax.set_title('原始波形数据')
+            ax.set_xlabel('时间 (s)')
+            ax.set_ylabel('振幅')
+            # 重要：使用原始数据的实际振幅范围，不进行归一化
+            ax.relim()  # 重新计算限制
+            ax.autoscale()  # 自动缩放到实际数据范围
+        else:
+            # 归一化波形
+            t_plot, y_plot = _minmax_downsample(self.time_axis, self.normalized_data, n_out)
+            self._set_line(t_plot, y_plot, 'g', '归一化波形')
+            ax.set_title('归一化波形数据')
+            ax.set_xlabel('时间 (s)')
+            ax.set_ylabel('归一化振幅')
+            ax.relim()
+            ax.autoscale(axis='x')
+            # 归一化的情况下，明确设置Y轴范围为[-1.1, 1.1]，略大于标准化后的[-1, 1]范围
+            ax.set_ylim(-1.1, 1.1)
+    
+    def _line_axes(self):
+        """返回波形与频谱共用的坐标轴，仅在首次使用或时频图之后重建"""
+        if self._ax is None:
+            self.fig.clear()
+            self._spec_ax = self._mesh = self._cbar = None
+            self._ax = self.fig.add_subplot(111)
+            self._line, = self._ax.plot([], [], '-')
+        return self._ax
+    
+    def _spectrogram_axes(self):
+        """返回时频图坐标轴，仅在首次使用或波形/频谱视图之后重建"""
+        if self._spec_ax is None:
+            self.fig.clear()
+            self._ax = self._line = None
+            self._spec_ax = self.fig.add_subplot(111)
+        return self._spec_ax
+    
+    def _set_line(self, x, y, color, label):
+        """更新共用曲线的数据、颜色和图例标签"""
+        self._line.set_data(x, y)
+        self._line.set_color(color)
+        self._line.set_label(label)
+    
+    def schedule_zoom(self, value):
+        """缩放滑块变化时立即更新标签，30毫秒内的连续变化合并为一次重绘"""
+        self.zoom_label.setText(f"缩放: {value}%")
+        self._zoom_timer.start(30)
+    
+    def apply_pending_zoom(self):
+        """按滑块当前值执行尚未完成的缩放"""
+        self._zoom_timer.stop()
+        self.update_zoom(self.zoom_slider.value())
     
     def update_zoom(self, value):
         """更新缩放级别"""
         zoom_percent = value
         self.zoom_label.setText(f"缩放: {zoom_percent}%")
         
+        # 根据当前显示类型计算新的Y轴范围
+        ylim = None
+        y_scale = 100 / zoom_percent
+        if self.raw_radio.isChecked():
+            # 原始波形 - 基于原始数据的振幅范围缩放
+            if self.current_data is not None:
+                # 计算原始数据的振幅范围
+                y_range = np.max(np.abs(self.current_data))
+                # 获取当前视图的中心
+                y_center = np.mean(self.current_data)  # 或者可以使用0作为中心
+                ylim = (y_center - y_range * y_scale, y_center + y_range * y_scale)
+        
+        elif self.normalized_radio.isChecked():
+            # 归一化波形 - 基于[-1,1]的范围缩放
+            if self.normalized_data is not None:
+                ylim = (-1 * y_scale, 1 * y_scale)
+                
+        # 频谱和时频图不需要在这里处理缩放，因为它们有自己的显示范围逻辑
+        
+        if self.is_trace_plot_active():
+            if ylim is not None:
+                self.pg_plot.setYRange(*ylim, padding=0)
+            return
+        
         # 实际缩放操作
         if hasattr(self, 'fig') and self.fig.axes:
             ax = self.fig.axes[0]
-            
-            # 根据当前显示类型使用不同的缩放策略
-            if self.raw_radio.isChecked():
-                # 原始波形 - 基于原始数据的振幅范围缩放
-                if self.current_data is not None:
-                    # 计算原始数据的振幅范围
-                    y_range = np.max(np.abs(self.current_data))
-                    y_scale = 100 / zoom_percent
-                    # 获取当前视图的中心
-                    y_center = np.mean(self.current_data)  # 或者可以使用0作为中心
-                    # 设置新的视图范围
-                    ax.set_ylim(y_center - y_range * y_scale, y_center + y_range * y_scale)
-            
-            elif self.normalized_radio.isChecked():
-                # 归一化波形 - 基于[-1,1]的范围缩放
-                if self.normalized_data is not None:
-                    y_scale = 100 / zoom_percent
-                    ax.set_ylim(-1 * y_scale, 1 * y_scale)
-                    
-            # 频谱和时频图不需要在这里处理缩放，因为它们有自己的显示范围逻辑
-            
-            self.canvas.draw()
+            if ylim is not None:
+                ax.set_ylim(*ylim)
+                if self.canvas.supports_blit:
+                    # 仅Y轴范围变化，只重绘该坐标轴
+                    self._blit_axes(ax)
+                    return
+            
+            self.canvas.draw_idle()
+    
+    def _invalidate_blit_background(self, canvas=None):
+        """使画布（默认为主画布）的blit背景缓存失效，在图形重建或画布尺寸变化时调用"""
+        self._blit_bgs.pop(canvas or self.canvas, None)
+    
+    def _blit_axes(self, ax, canvas=None):
+        """
+        局部重绘单个坐标轴（含刻度、网格、图例和曲线），canvas默认为主画布
+        
+        背景缓存为隐藏该坐标轴后的整张图，恢复背景可同时擦除旧的刻度标签
+        """
+        canvas = canvas or self.canvas
+        fig = canvas.figure
+        bg = self._blit_bgs.get(canvas)
+        if bg is None:
+            ax.set_visible(False)
+            canvas.draw()
+            bg = self._blit_bgs[canvas] = canvas.copy_from_bbox(fig.bbox)
+            ax.set_visible(True)
+        
+        canvas.restore_region(bg)
+        fig.draw_artist(ax)
+        canvas.blit(fig.bbox)
     
     def update_display_options(self):
         """更新显示选项"""
+        if self.is_trace_plot_active():
+            show_grid = self.grid_checkbox.isChecked()
+            self.pg_plot.showGrid(x=show_grid, y=show_grid)
+            self.pg_legend.setVisible(self.legend_checkbox.isChecked())
+            return
+        
         if hasattr(self, 'fig') and self.fig.axes:
             ax = self.fig.axes[0]
             
@@ -824,7 +1387,7 @@ class WaveDisplayWidget(QWidget):
                 if ax.get_legend():
                     ax.get_legend().remove()
             
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def on_display_button_clicked(self):
         """显示按钮点击处理"""
@@ -838,9 +1401,12 @@ class WaveDisplayWidget(QWidget):
             # 现在只是模拟一些数据
             sample_count = 1000
             sample_interval = 0.001
-            wave_data = np.sin(2 * np.pi * 10 * np.arange(sample_count) * sample_interval) + \
-                       0.5 * np.sin(2 * np.pi * 50 * np.arange(sample_count) * sample_interval) + \
-                       0.3 * np.random.randn(sample_count)
+            # 确定性的正弦分量只生成一次，每次点击只叠加新的噪声
+            if self._sim_wave is None:
+                t = np.arange(sample_count) * sample_interval
+                self._sim_wave = np.sin(2 * np.pi * 10 * t) + 0.5 * np.sin(2 * np.pi * 50 * t)
+                self._rng = np.random.default_rng()
+            wave_data = self._sim_wave + 0.3 * self._rng.standard_normal(sample_count)
             time_data = {'start': 0.2, 'end': 0.8}
             
             self.show_wave_data(sample_count, sample_interval, trace_number, wave_data, time_data)
@@ -863,7 +1429,7 @@ class WaveDisplayWidget(QWidget):
             
         if file_path:
             try:
-                self.fig.savefig(file_path, dpi=300, bbox_inches='tight')
+                self.export_figure(file_path, dpi=300, bbox_inches='tight')
                 QMessageBox.information(self, "保存成功", f"图像已保存至: {file_path}")
             except Exception as e:
                 error_msg = f"保存图像失败: {str(e)}"
@@ -872,6 +1438,14 @@ class WaveDisplayWidget(QWidget):
     
     def reset_view(self):
         """重置视图"""
+        if self.is_trace_plot_active():
+            if self.raw_radio.isChecked():
+                self.pg_plot.enableAutoRange()
+            else:
+                self.pg_plot.setYRange(-1.1, 1.1, padding=0)
+            self.zoom_slider.setValue(100)
+            return
+        
         if hasattr(self, 'fig') and self.fig.axes:
             ax = self.fig.axes[0]
             
@@ -895,7 +1469,7 @@ class WaveDisplayWidget(QWidget):
             # 重置缩放滑块
             self.zoom_slider.setValue(100)
             
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def analyze_waveform(self):
         """分析波形"""
@@ -928,60 +1502,58 @@ class WaveDisplayWidget(QWidget):
             QMessageBox.warning(self, "警告", "请先加载波形数据！")
             return
             
+        from scipy.fft import rfft, rfftfreq, next_fast_len
+        
         try:
             # 获取参数
             window_size = self.window_size_spin.value()
+            # 窗口长度对齐到小质因子长度，避免素数长度的慢速FFT
+            smooth_size = _smooth_len_below(window_size)
+            if smooth_size != window_size:
+                logger.info("窗口大小 %d 调整为 %d", window_size, smooth_size)
+                window_size = smooth_size
             window_type = self.window_combo.currentText()
             spectrum_type = self.spectrum_combo.currentText()
             scale_type = self.scale_combo.currentText()
             
-            logger.info(f"频谱参数: 窗口大小={window_size}, 窗口类型={window_type}, " 
-                       f"频谱类型={spectrum_type}, 缩放类型={scale_type}")
+            logger.info("频谱参数: 窗口大小=%s, 窗口类型=%s, 频谱类型=%s, 缩放类型=%s",
+                        window_size, window_type, spectrum_type, scale_type)
             
-            # 清除现有图表
-            self.spectrum_fig.clear()
-            ax = self.spectrum_fig.add_subplot(111)
+            # 数据和参数都未变化时当前图表已是最新，直接返回
+            spec_key = (id(self.current_data), self.current_data.shape[0],
+                        window_size, window_type, spectrum_type, scale_type)
+            if spec_key == self._spec_last_key and self._spectrum_ax is not None:
+                logger.info("频谱参数未变化，跳过重新计算")
+                return
             
             # 应用窗口函数
             logger.info("应用窗口函数")
-            window_dict = {
-                "矩形窗": 'boxcar',
-                "汉宁窗": 'hann',
-                "汉明窗": 'hamming',
-                "布莱克曼窗": 'blackman',
-                "平顶窗": 'flattop'
-            }
-            window = signal.get_window(window_dict[window_type], min(window_size, len(self.current_data)))
+            window_name = self._WINDOW_NAMES[window_type]
+            window = _get_window(window_name, min(window_size, len(self.current_data)))
             
             # 计算频谱
             if len(self.current_data) >= window_size:
-                logger.info(f"计算频谱，数据长度={len(self.current_data)}")
+                logger.info("计算频谱，数据长度=%d", len(self.current_data))
                 # 采样率
-                sample_rate = 1 / (self.time_axis[1] - self.time_axis[0])
-                logger.info(f"采样率: {sample_rate} Hz")
+                sample_rate = 1 / self._dt
+                logger.info("采样率: %s Hz", sample_rate)
                 
                 # 计算频谱
                 if spectrum_type == "幅度谱":
                     logger.info("计算幅度谱")
-                    f, Pxx = signal.welch(self.current_data, fs=sample_rate, window=window,
-                                         nperseg=window_size, scaling='spectrum')
+                    f, Pxx = self._cached_welch(window_name, window, sample_rate, 'spectrum')
                     Pxx = np.sqrt(Pxx)  # 取平方根得到幅度谱
                     
                     # 忽略前5%的频率点，避免直流和极低频分量影响显示
-                    cutoff_idx = max(1, int(0.05 * len(f)))
-                    f = f[cutoff_idx:]
-                    Pxx = Pxx[cutoff_idx:]
+                    f, Pxx = self._trim_dc(f, Pxx)
                     
                     ylabel = "幅度"
                 elif spectrum_type == "功率谱":
                     logger.info("计算功率谱")
-                    f, Pxx = signal.welch(self.current_data, fs=sample_rate, window=window,
-                                         nperseg=window_size)
+                    f, Pxx = self._cached_welch(window_name, window, sample_rate, 'density')
                     
                     # 忽略前5%的频率点，避免直流和极低频分量影响显示
-                    cutoff_idx = max(1, int(0.05 * len(f)))
-                    f = f[cutoff_idx:]
-                    Pxx = Pxx[cutoff_idx:]
+                    f, Pxx = self._trim_dc(f, Pxx)
                     
                     # 对数转换，降低动态范围
                     if scale_type == "对数":
@@ -991,53 +1563,59 @@ class WaveDisplayWidget(QWidget):
                         ylabel = "功率密度"
                 else:  # 相位谱
                     logger.info("计算相位谱")
-                    # 前处理：移除基线和应用窗函数
-                    baseline = np.mean(self.current_data[:100])
-                    data_centered = self.current_data[:window_size] - baseline
-                    windowed_data = data_centered * window
+                    # 前处理：移除基线（加载数据时已计算）和应用窗函数，写入复用的缓冲区
+                    if self._phase_buf is None or self._phase_buf.size != window_size:
+                        self._phase_buf = np.empty(window_size, dtype=np.float32)
+                    windowed_data = self._phase_buf
+                    np.subtract(self.current_data[:window_size], np.float32(self._baseline), out=windowed_data)
+                    windowed_data *= window
                     
-                    f = np.fft.rfftfreq(window_size, d=1/sample_rate)
-                    Pxx = np.angle(np.fft.rfft(windowed_data))
+                    # 补零到快速FFT长度，多线程计算
+                    nfft = next_fast_len(window_size, real=True)
+                    f = rfftfreq(nfft, d=1/sample_rate)
+                    Pxx = np.angle(rfft(windowed_data, n=nfft, workers=-1))
                     
                     # 忽略前几个频率点
-                    cutoff_idx = max(1, int(0.05 * len(f)))
-                    f = f[cutoff_idx:]
-                    Pxx = Pxx[cutoff_idx:]
+                    f, Pxx = self._trim_dc(f, Pxx)
                     
                     ylabel = "相位 (rad)"
                 
-                # 绘制频谱
+                # 绘制频谱，复用已有的坐标轴和曲线，只更新数据
                 logger.info("绘制频谱")
-                if scale_type == "线性":
-                    ax.plot(f, Pxx, 'r-', linewidth=1.5)
-                else:  # 对数
-                    if spectrum_type != "相位谱":  # 相位谱不能取对数
-                        ax.semilogy(f, Pxx, 'r-', linewidth=1.5)
-                    else:
-                        ax.plot(f, Pxx, 'r-', linewidth=1.5)
+                ax, created = self._spectrum_axes()
+                self._spec_line.set_data(f, Pxx)
+                # 相位谱不能取对数
+                log_scale = scale_type != "线性" and spectrum_type != "相位谱"
+                ax.set_yscale('log' if log_scale else 'linear')
                 
                 ax.set_title(f'{spectrum_type} - {window_type}')
                 ax.set_xlabel('频率 (Hz)')
                 ax.set_ylabel(ylabel)
-                ax.grid(True, linestyle='--', alpha=0.7)
+                ax.relim(visible_only=True)
+                ax.autoscale_view()
                 
                 # 添加频谱特征信息
                 max_idx = np.argmax(Pxx)
                 peak_freq = f[max_idx]
                 peak_value = Pxx[max_idx]
                 
-                logger.info(f"峰值频率: {peak_freq} Hz, 峰值: {peak_value}")
+                logger.info("峰值频率: %s Hz, 峰值: %s", peak_freq, peak_value)
                 
-                if spectrum_type != "相位谱":
-                    ax.axvline(x=peak_freq, color='g', linestyle='--', alpha=0.7)
-                    ax.text(0.95, 0.95, f"峰值频率: {peak_freq:.2f} Hz\n峰值: {peak_value:.4f}",
-                           verticalalignment='top', horizontalalignment='right',
-                           transform=ax.transAxes, bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+                show_peak = spectrum_type != "相位谱"
+                self._spec_peakline.set_xdata([peak_freq, peak_freq])
+                self._spec_peakline.set_visible(show_peak)
+                self._spec_text.set_text(f"峰值频率: {peak_freq:.2f} Hz\n峰值: {peak_value:.4f}")
+                self._spec_text.set_visible(show_peak)
                 
-                # 优化布局
-                self.spectrum_fig.tight_layout()
                 logger.info("更新canvas显示")
-                self.spectrum_canvas.draw()
+                if created:
+                    # 首次创建时优化布局并完整绘制
+                    self.spectrum_fig.tight_layout()
+                    self.spectrum_canvas.draw_idle()
+                else:
+                    # 之后只重绘频谱坐标轴
+                    self._blit_axes(ax, self.spectrum_canvas)
+                self._spec_last_key = spec_key
                 
             else:
                 error_msg = f"数据长度({len(self.current_data)})小于窗口大小({window_size})!"
@@ -1050,14 +1628,136 @@ class WaveDisplayWidget(QWidget):
             logger.error(traceback.format_exc())
             QMessageBox.warning(self, "警告", error_msg)
     
+    def _trim_dc(self, f, Pxx, frac=0.05):
+        """去掉频谱前frac比例（至少1个）的低频点，返回的是原数组的视图"""
+        i = max(1, int(frac * len(f)))
+        return f[i:], Pxx[i:]
+    
+    def _spectrum_axes(self):
+        """
+        返回频谱图坐标轴及其是否为新建
+        坐标轴、频谱曲线、峰值线和峰值标注只创建一次，之后的刷新只更新数据
+        """
+        if self._spectrum_ax is not None:
+            return self._spectrum_ax, False
+        
+        self.spectrum_fig.clear()
+        self._invalidate_blit_background(self.spectrum_canvas)
+        ax = self.spectrum_fig.add_subplot(111)
+        self._spec_line, = ax.plot([], [], 'r-', linewidth=1.5)
+        self._spec_peakline = ax.axvline(x=0, color='g', linestyle='--', alpha=0.7)
+        self._spec_text = ax.text(0.95, 0.95, '',
+                                  verticalalignment='top', horizontalalignment='right',
+                                  transform=ax.transAxes, bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+        ax.grid(True, linestyle='--', alpha=0.7)
+        self._spectrum_ax = ax
+        return ax, True
+    
+    def _cached_welch(self, window_name, window, sample_rate, scaling):
+        """计算当前波形的Welch功率谱，按窗函数和缩放方式缓存，加载新数据时清空"""
+        key = (window_name, window.size, sample_rate, scaling)
+        cached = self._welch_cache.get(key)
+        if cached is None:
+            from Services import stft_accel
+            # 直流及极低频分量显示前会被截去，无需逐段去均值
+            cached = stft_accel.welch(self.current_data, sample_rate, window, scaling, detrend=False)
+            self._welch_cache[key] = cached
+        return cached
+    
+    def schedule_filter(self, *args):
+        """
+        滤波参数变化时延迟重新滤波
+        仅在已手动应用过滤波后生效，150毫秒内的连续调整合并为一次计算
+        """
+        if not self._filter_applied:
+            return
+        if self.start_time_spin.value() >= self.end_time_spin.value():
+            return
+        self._filter_timer.start(150)
+
+    def _filter_axes(self):
+        """
+        返回滤波结果页的上下两个坐标轴
+        坐标轴、曲线、网格和图例只在首次滤波时创建并优化一次布局
+        """
+        if self._tf_axes is None:
+            self.tf_fig.clear()
+            ax1, ax2 = self.tf_fig.subplots(2, 1)
+            
+            self._tf_raw_line, = ax1.plot([], [], 'b-', label='原始数据')
+            ax1.set_ylabel('振幅')
+            ax1.grid(True, linestyle='--', alpha=0.7)
+            ax1.legend()
+            
+            self._tf_filtered_line, = ax2.plot([], [], 'r-', label='滤波后数据')
+            ax2.set_xlabel('时间 (s)')
+            ax2.set_ylabel('振幅')
+            ax2.grid(True, linestyle='--', alpha=0.7)
+            ax2.legend()
+            
+            # 优化布局
+            self.tf_fig.tight_layout()
+            self._tf_axes = (ax1, ax2)
+        return self._tf_axes
+    
+    def _butter_filter(self, data_segment, filter_type, cutoff, nyq):
+        """
+        对数据段做零相位巴特沃斯滤波
+        带通和带阻需要两个截止频率，这里简化为以cutoff为中心、宽20 Hz的频带
+        """
+        btype = self._BUTTER_TYPES[filter_type]
+        if btype in ('low', 'high'):
+            logger.info("应用%s滤波器, 截止频率: %s Hz", filter_type, cutoff)
+            wn = cutoff / nyq
+        else:
+            low_cutoff = max(1, cutoff - 10)
+            high_cutoff = cutoff + 10
+            logger.info("应用%s滤波器, 截止频率: %s-%s Hz", filter_type, low_cutoff, high_cutoff)
+            wn = (low_cutoff / nyq, high_cutoff / nyq)
+        
+        # 归一化截止频率必须在(0, 1)内，否则scipy会直接抛出异常
+        if not all(0 < w < 1 for w in np.atleast_1d(wn)):
+            raise ValueError(f"截止频率必须在 0 到奈奎斯特频率 {nyq:g} Hz 之间！")
+        
+        from scipy import signal
+        return signal.sosfiltfilt(self._butter_sos(btype, wn), data_segment)
+    
+    def _butter_sos(self, btype, wn):
+        """
+        获取4阶巴特沃斯滤波器的二阶节(SOS)系数，按类型和归一化截止频率缓存
+        SOS形式比ba形式数值更稳定
+        """
+        key = (btype, tuple(np.round(np.atleast_1d(wn), 6)))
+        sos = self._butter_cache.get(key)
+        if sos is None:
+            from scipy import signal
+            # 系数与float32数据保持一致，滤波全程以float32计算
+            sos = signal.butter(4, wn, btype=btype, output='sos').astype(np.float32)
+            self._butter_cache[key] = sos
+        return sos
+    
     def apply_filter(self):
-        """应用滤波器"""
+        """应用滤波器（点击按钮时调用，出错时弹出提示）"""
+        self._apply_filter(interactive=True)
+    
+    def _filter_warning(self, message, interactive):
+        """记录滤波参数错误，仅在用户手动应用滤波时弹出提示框"""
+        logger.warning(message)
+        if interactive:
+            QMessageBox.warning(self, "警告", message)
+    
+    def _apply_filter(self, interactive):
+        """
+        按当前参数滤波并绘制结果
+        interactive 为 False 时（参数变化后的自动重新滤波）只记录日志，不弹出提示框打断输入
+        """
         logger.info("执行apply_filter")
-        if self.current_data is None:
-            logger.warning("当前没有加载波数据")
-            QMessageBox.warning(self, "警告", "请先加载波形数据！")
+        if self.current_data is None or not self._loaded:
+            self._filter_warning("请先加载波形数据！", interactive)
             return
             
+        from scipy import ndimage
+        
         try:
             # 获取参数
             filter_type = self.filter_combo.currentText()
@@ -1067,33 +1767,34 @@ class WaveDisplayWidget(QWidget):
             
             # 验证时间范围
             if start_time >= end_time:
-                error_msg = "起始时间必须小于结束时间！"
-                logger.warning(error_msg)
-                QMessageBox.warning(self, "警告", error_msg)
+                self._filter_warning("起始时间必须小于结束时间！", interactive)
                 return
                 
-            max_time = len(self.current_data) * (self.time_axis[1] - self.time_axis[0])
+            sample_interval = self._dt
+            max_time = len(self.current_data) * sample_interval
             if end_time > max_time:
                 end_time = max_time
                 self.end_time_spin.setValue(end_time)
-                logger.warning(f"结束时间超出范围，已调整为最大值: {max_time}s")
+                logger.warning("结束时间超出范围，已调整为最大值: %ss", max_time)
             
-            logger.info(f"滤波参数: 滤波类型={filter_type}, 截止频率={cutoff} Hz, " 
-                       f"时间范围={start_time}s - {end_time}s")
+            logger.info("滤波参数: 滤波类型=%s, 截止频率=%s Hz, 时间范围=%ss - %ss",
+                        filter_type, cutoff, start_time, end_time)
             
-            # 计算起始和结束索引
-            sample_interval = self.time_axis[1] - self.time_axis[0]
-            start_idx = max(0, int(start_time / sample_interval))
-            end_idx = min(len(self.current_data), int(end_time / sample_interval))
+            # 计算起始和结束索引：等间隔时间轴直接换算，否则在时间轴上二分查找
+            if self._is_uniform_grid:
+                start_idx = max(0, int(start_time / sample_interval))
+                end_idx = min(len(self.current_data), int(end_time / sample_interval))
+            else:
+                start_idx = int(np.searchsorted(self.time_axis, start_time, side='left'))
+                end_idx = min(len(self.current_data),
+                              int(np.searchsorted(self.time_axis, end_time, side='right')))
             
             # 确保有足够的数据点用于滤波
             if end_idx - start_idx < 10:
-                error_msg = "选择的时间范围太小，请选择更大的时间范围！"
-                logger.warning(error_msg)
-                QMessageBox.warning(self, "警告", error_msg)
+                self._filter_warning("选择的时间范围太小，请选择更大的时间范围！", interactive)
                 return
             
-            logger.info(f"数据范围索引: {start_idx} - {end_idx}, 数据长度: {end_idx - start_idx}")
+            logger.info("数据范围索引: %d - %d, 数据长度: %d", start_idx, end_idx, end_idx - start_idx)
             
             # 获取需要处理的数据段
             data_segment = self.current_data[start_idx:end_idx]
@@ -1101,112 +1802,88 @@ class WaveDisplayWidget(QWidget):
             
             # 采样率
             sample_rate = 1 / sample_interval
-            logger.info(f"采样率: {sample_rate} Hz")
+            logger.info("采样率: %s Hz", sample_rate)
             
             # 应用滤波器
             filtered_data = None
             nyq = 0.5 * sample_rate  # 奈奎斯特频率
             
-            if filter_type == "低通":
-                logger.info(f"应用低通滤波器, 截止频率: {cutoff} Hz")
-                b, a = signal.butter(4, cutoff/nyq, btype='low')
-                filtered_data = signal.filtfilt(b, a, data_segment)
-            elif filter_type == "高通":
-                logger.info(f"应用高通滤波器, 截止频率: {cutoff} Hz")
-                b, a = signal.butter(4, cutoff/nyq, btype='high')
-                filtered_data = signal.filtfilt(b, a, data_segment)
-            elif filter_type == "带通":
-                # 带通需要两个截止频率，这里简化处理
-                low_cutoff = max(1, cutoff - 10)
-                high_cutoff = cutoff + 10
-                logger.info(f"应用带通滤波器, 截止频率: {low_cutoff}-{high_cutoff} Hz")
-                b, a = signal.butter(4, [low_cutoff/nyq, high_cutoff/nyq], btype='band')
-                filtered_data = signal.filtfilt(b, a, data_segment)
-            elif filter_type == "带阻":
-                # 带阻需要两个截止频率，这里简化处理
-                low_cutoff = max(1, cutoff - 10)
-                high_cutoff = cutoff + 10
-                logger.info(f"应用带阻滤波器, 截止频率: {low_cutoff}-{high_cutoff} Hz")
-                b, a = signal.butter(4, [low_cutoff/nyq, high_cutoff/nyq], btype='bandstop')
-                filtered_data = signal.filtfilt(b, a, data_segment)
+            if filter_type in self._BUTTER_TYPES:
+                filtered_data = self._butter_filter(data_segment, filter_type, cutoff, nyq)
             else:  # 中值滤波
                 kernel_size = int(min(51, len(data_segment) / 10))
                 # 确保kernel_size是奇数
                 if kernel_size % 2 == 0:
                     kernel_size += 1
-                logger.info(f"应用中值滤波, 核大小: {kernel_size}")
-                filtered_data = signal.medfilt(data_segment, kernel_size)
-            
-            # 清除图表并绘制结果
-            logger.info("清除图表并绘制结果")
-            self.tf_fig.clear()
+                logger.info("应用中值滤波, 核大小: %d", kernel_size)
+                filtered_data = ndimage.median_filter(data_segment, size=kernel_size, mode='nearest')
             
-            # 创建2x1图表布局
-            ax1 = self.tf_fig.add_subplot(211)
-            ax2 = self.tf_fig.add_subplot(212)
+            # 绘制结果，复用已有的坐标轴和曲线，只更新数据
+            logger.info("绘制结果")
+            ax1, ax2 = self._filter_axes()
             
             # 绘制原始数据
             logger.info("绘制原始数据")
-            ax1.plot(time_segment, data_segment, 'b-', label='原始数据')
+            self._tf_raw_line.set_data(time_segment, data_segment)
             ax1.set_title(f'原始数据 ({start_time:.2f}s - {end_time:.2f}s)')
-            ax1.set_ylabel('振幅')
-            ax1.grid(True, linestyle='--', alpha=0.7)
-            ax1.legend()
             
             # 绘制滤波后的数据
             logger.info("绘制滤波后的数据")
-            ax2.plot(time_segment, filtered_data, 'r-', label='滤波后数据')
+            self._tf_filtered_line.set_data(time_segment, filtered_data)
             ax2.set_title(f'{filter_type} (截止频率: {cutoff} Hz)')
-            ax2.set_xlabel('时间 (s)')
-            ax2.set_ylabel('振幅')
-            ax2.grid(True, linestyle='--', alpha=0.7)
-            ax2.legend()
             
-            # 优化布局
-            self.tf_fig.tight_layout()
+            for ax in (ax1, ax2):
+                ax.relim()
+                ax.autoscale_view()
+            
             logger.info("更新canvas显示")
-            self.tf_canvas.draw()
+            self.tf_canvas.draw_idle()
+            self._filter_applied = True
             
         except Exception as e:
             error_msg = f"应用滤波器时出错: {str(e)}"
+            if not interactive:
+                # 输入过程中的中间参数（如截止频率为0或超过奈奎斯特频率）很常见，只记录日志
+                logger.warning(error_msg)
+                return
             logger.error(error_msg)
             logger.error(traceback.format_exc())
             QMessageBox.warning(self, "警告", error_msg)
 
     def set_full_time_range(self):
         """设置为全部时间范围"""
-        if self.time_axis is None:
+        if not self._loaded:
             return
         
-        max_time = len(self.current_data) * (self.time_axis[1] - self.time_axis[0])
+        max_time = len(self.current_data) * self._dt
         self.start_time_spin.setValue(0)
         self.end_time_spin.setValue(max_time)
-        logger.info(f"设置时间范围: 0 - {max_time}s")
+        logger.info("设置时间范围: 0 - %ss", max_time)
         
     def set_time_range(self, start, end):
         """设置指定的时间范围"""
-        if self.time_axis is None:
+        if not self._loaded:
             return
             
-        max_time = len(self.current_data) * (self.time_axis[1] - self.time_axis[0])
+        max_time = len(self.current_data) * self._dt
         
-        # 确保范围在有效范围内
-        start = max(0, min(start, max_time))
-        end = max(0, min(end, max_time))
+        # 确保范围在有效范围内，起止时间一次性裁剪
+        start, end = np.clip([start, end], 0.0, max_time).tolist()
         
         if start >= end:
+            logger.warning("时间范围无效，已忽略: %s - %ss", start, end)
             return
             
         self.start_time_spin.setValue(start)
         self.end_time_spin.setValue(end)
-        logger.info(f"设置时间范围: {start} - {end}s")
+        logger.info("设置时间范围: %s - %ss", start, end)
         
     def set_middle_time_range(self):
         """设置为中间5秒"""
-        if self.time_axis is None:
+        if not self._loaded:
             return
             
-        max_time = len(self.current_data) * (self.time_axis[1] - self.time_axis[0])
+        max_time = len(self.current_data) * self._dt
         
         if max_time <= 5:
             self.set_full_time_range()
@@ -1220,10 +1897,10 @@ class WaveDisplayWidget(QWidget):
         
     def set_last_time_range(self):
         """设置为最后5秒"""
-        if self.time_axis is None:
+        if not self._loaded:
             return
             
-        max_time = len(self.current_data) * (self.time_axis[1] - self.time_axis[0])
+        max_time = len(self.current_data) * self._dt
         
         if max_time <= 5:
             self.set_full_time_range()
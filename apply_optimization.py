@@ -1,4 +1,17 @@
-import re
+import ast
+
+
+def find_function_lines(source, name):
+    """
+    在源代码中查找顶层函数定义，返回其起止行号（从1开始，包含结束行）
+    使用ast解析，避免正则表达式在长文件上的回溯和对字符串中def的误匹配
+    """
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            start = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            return start, node.end_lineno
+    return None
+
 
 # 读取优化后的函数
 with open('optimize_source_location.py', 'r') as f:
@@ -8,31 +21,29 @@ with open('optimize_source_location.py', 'r') as f:
 with open('Services/ssatop.py', 'r') as f:
     original_content = f.read()
 
-# 定义正则表达式模式来匹配calculate_source_location函数
-pattern = r'def calculate_source_location\([^)]*\):.*?(?=\n\s*def|\n\s*if __name__ == \'__main__\'|\Z)'
-
-# 使用re.DOTALL标志来匹配多行
-match = re.search(pattern, original_content, re.DOTALL)
+# 定位原始文件中的calculate_source_location函数
+original_span = find_function_lines(original_content, 'calculate_source_location')
 
-if match:
-    # 提取函数定义
-    original_function = match.group(0)
-    
+if original_span:
     # 从优化后的文件中提取函数定义
-    optimized_match = re.search(r'def optimized_calculate_source_location\([^)]*\):.*', optimized_function, re.DOTALL)
-    if optimized_match:
-        optimized_function_content = optimized_match.group(0)
-        
+    optimized_span = find_function_lines(optimized_function, 'optimized_calculate_source_location')
+    if optimized_span:
+        optimized_lines = optimized_function.splitlines(keepends=True)
+        optimized_function_content = ''.join(optimized_lines[optimized_span[0] - 1:optimized_span[1]])
+
         # 替换函数名
         optimized_function_content = optimized_function_content.replace('optimized_calculate_source_location', 'calculate_source_location')
-        
-        # 替换原始函数
-        new_content = original_content.replace(original_function, optimized_function_content)
-        
+
+        # 按行号替换原始函数
+        original_lines = original_content.splitlines(keepends=True)
+        new_content = (''.join(original_lines[:original_span[0] - 1])
+                       + optimized_function_content
+                       + ''.join(original_lines[original_span[1]:]))
+
         # 写回文件
         with open('Services/ssatop.py', 'w') as f:
             f.write(new_content)
-        
+
         print("成功替换calculate_source_location函数")
     else:
         print("无法在优化文件中找到函数定义")
@@ -1,50 +1,51 @@
 import sys
 import os
-from Models.TraceFile import TraceFile
+import glob
 from Models.Config import Config
 from Models.ThemeManager import ThemeManager
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget, QMessageBox,
     QHBoxLayout, QSplitter, QFrame, QLabel, QStackedWidget, QPushButton,
     QScrollArea, QSizePolicy, QToolBar, QToolButton, QMenu, QStatusBar,
-    QProgressBar, QSpacerItem
+    QProgressBar, QSpacerItem, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QSize, QRect, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QIcon, QFont, QColor, QPixmap, QAction
-from Views.FileUploadWidget import FileUploadWidget
-from Views.WaveDisplayWidget import WaveDisplayWidget
-from Views.SourceDetectionWidget import SourceDetectionWidget
-from Views.SettingsWidget import SettingsWidget
-from Views.ModelSettingWidget import ModelSettingWidget
-from Views.ThemeSettingsWidget import ThemeSettingsWidget
-from Views.BatchProcessingWidget import BatchProcessingWidget
-from Controllers.FileUploadWidgetController import FileUploadWidgetController
-from Controllers.WaveDisplayWidgetController import WaveDisplayWidgetController
-from Controllers.SourceDetectionWidgetController import SourceDetectionWidgetController
-from Controllers.SettingsWidgetController import SettingsWidgetController
-from Controllers.ModelSettingWidgetController import ModelSettingWidgetController
-from Controllers.ThemeSettingsWidgetController import ThemeSettingsWidgetController
-from Controllers.BatchProcessingWidgetController import BatchProcessingWidgetController
+from PyQt6.QtCore import Qt, QSize, QTimer, QThread, pyqtSignal, pyqtSlot, QMetaObject, Q_ARG, QRect, QPropertyAnimation, QEasingCurve
+from PyQt6.QtGui import QIcon, QFont, QColor, QPixmap, QAction, QPainter
 import traceback
 import threading
 
 class NavigationButton(QPushButton):
     """现代化导航按钮"""
+    # 所有导航按钮共用的尺寸策略和图标尺寸，只创建一次
+    _SIZE_POLICY = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+    _ICON_SIZE = QSize(20, 20)
+
     def __init__(self, text, icon_path=None, parent=None):
         super(NavigationButton, self).__init__(text, parent)
         self.setFixedHeight(48)
         self.setCheckable(True)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setSizePolicy(self._SIZE_POLICY)
         
         # 设置图标（如果有）
         if icon_path:
             self.setIcon(QIcon(icon_path))
-            self.setIconSize(QSize(20, 20))
+            self.setIconSize(self._ICON_SIZE)
         
         # 不在这里设置样式，样式会由主题管理器控制
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # 页面标题，按内容区页面索引排列
+    PAGE_TITLES = ("波数据展示", "源位置检测", "批量处理", "速度模型", "文件管理", "系统设置", "主题设置")
+
+    # 自身管理滚动/视口的页面（波数据展示、批量处理、主题设置），不再额外包一层滚动区域
+    SELF_SCROLLING_PAGES = frozenset((0, 2, 6))
+
+    # 状态指示灯颜色
+    INDICATOR_RED = "#F44336"
+    INDICATOR_AMBER = "#FFC107"
+    INDICATOR_GREEN = "#4CAF50"
+
+    def __init__(self, theme_manager=None):
         super().__init__()
         self.setWindowTitle("波数据分析系统")
         self.setMinimumSize(1280, 800)
@@ -53,31 +54,30 @@ class MainWindow(QMainWindow):
         self.is_maximized = False
         
         # 初始化主题管理器
-        self.theme_manager = ThemeManager()
-
-        # 创建视图
-        self.file_upload_widget = FileUploadWidget()
-        self.wave_display_widget = WaveDisplayWidget()
-        self.source_detection_widget = SourceDetectionWidget()
-        self.settings_widget = SettingsWidget()
-        self.model_setting_widget = ModelSettingWidget()
-        self.theme_settings_controller = ThemeSettingsWidgetController()
-        self.batch_processing_widget = BatchProcessingWidget()
+        self.theme_manager = theme_manager if theme_manager is not None else ThemeManager()
 
-        # 创建控制器
-        self.file_upload_controller = FileUploadWidgetController(self.file_upload_widget)
-        self.wave_display_controller = WaveDisplayWidgetController(self.wave_display_widget)
-        self.source_detection_controller = SourceDetectionWidgetController(self.source_detection_widget)
-        self.settings_controller = SettingsWidgetController(self.settings_widget)
-        self.model_setting_controller = ModelSettingWidgetController(self.model_setting_widget)
-        self.batch_processing_controller = BatchProcessingWidgetController(self.batch_processing_widget)
-        
-        # 连接主题变更信号
-        self.theme_settings_controller.themeChanged.connect(self.apply_theme)
+        # 页面按需创建：首次切换到某页时才创建其视图和控制器
+        self._page_factories = {
+            0: self._create_wave_display_page,
+            1: self._create_source_detection_page,
+            2: self._create_batch_processing_page,
+            3: self._create_model_setting_page,
+            4: self._create_file_upload_page,
+            5: self._create_settings_page,
+            6: self._create_theme_settings_page,
+        }
+        self._pages = {}  # 已创建的页面：索引 -> 视图
         
         # 设置布局
         self.init_ui()
         
+        # 刷新请求和状态栏更新的合并
+        self._refresh_pending = False
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+        
         # 状态栏
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -92,16 +92,44 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
-        # 添加状态指示灯
+        # 添加状态指示灯，各颜色的圆点预先绘制为图像，切换时只替换图像而不重新解析样式表
+        self._indicator_pixmaps = {color: self._make_indicator_pixmap(color)
+                                   for color in (self.INDICATOR_RED, self.INDICATOR_AMBER, self.INDICATOR_GREEN)}
+        self._current_indicator_color = self.INDICATOR_GREEN
         self.status_indicator = QLabel()
-        self.status_indicator.setPixmap(QPixmap(16, 16))
-        self.status_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 8px;")
+        self.status_indicator.setPixmap(self._indicator_pixmaps[self.INDICATOR_GREEN])
         self.status_indicator.setFixedSize(16, 16)
         self.status_bar.addPermanentWidget(self.status_indicator)
 
+    @staticmethod
+    def _make_indicator_pixmap(color):
+        """绘制16x16的实心圆点图像，用作状态指示灯，按屏幕像素比绘制以适配高分屏"""
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(16 * ratio), round(16 * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(0, 0, 16, 16)
+        painter.end()
+        return pixmap
+
+    def _set_indicator_color(self, color):
+        """设置状态指示灯颜色，颜色未变化时不做任何操作"""
+        if color == self._current_indicator_color:
+            return
+        self._current_indicator_color = color
+        self.status_indicator.setPixmap(self._indicator_pixmaps[color])
+
     def init_ui(self):
+        # 批量创建子部件期间暂停界面更新，结束后统一布局和绘制一次
+        self.setUpdatesEnabled(False)
+        
         # 创建中央部件
         central_widget = QWidget()
+        central_widget.setUpdatesEnabled(False)
         main_layout = QHBoxLayout(central_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -132,10 +160,10 @@ class MainWindow(QMainWindow):
         navigation_label.setObjectName("sidebarLabel")
         sidebar_layout.addWidget(navigation_label)
         
-        self.btn_wave_display = NavigationButton("波数据展示")
-        self.btn_source_detection = NavigationButton("源位置检测")
-        self.btn_batch_processing = NavigationButton("批量处理")
-        self.btn_velocity_model = NavigationButton("速度模型")
+        self.btn_wave_display = NavigationButton(self.PAGE_TITLES[0])
+        self.btn_source_detection = NavigationButton(self.PAGE_TITLES[1])
+        self.btn_batch_processing = NavigationButton(self.PAGE_TITLES[2])
+        self.btn_velocity_model = NavigationButton(self.PAGE_TITLES[3])
         
         # 添加导航按钮到侧边栏
         sidebar_layout.addWidget(self.btn_wave_display)
@@ -148,9 +176,9 @@ class MainWindow(QMainWindow):
         system_label.setObjectName("sidebarLabel")
         sidebar_layout.addWidget(system_label)
         
-        self.btn_file_upload = NavigationButton("文件管理")
-        self.btn_settings = NavigationButton("系统设置")
-        self.btn_theme_settings = NavigationButton("主题设置")
+        self.btn_file_upload = NavigationButton(self.PAGE_TITLES[4])
+        self.btn_settings = NavigationButton(self.PAGE_TITLES[5])
+        self.btn_theme_settings = NavigationButton(self.PAGE_TITLES[6])
         
         sidebar_layout.addWidget(self.btn_file_upload)
         sidebar_layout.addWidget(self.btn_settings)
@@ -183,7 +211,7 @@ class MainWindow(QMainWindow):
         title_bar_layout = QHBoxLayout(title_bar)
         title_bar_layout.setContentsMargins(20, 0, 20, 0)
         
-        self.page_title = QLabel("波数据展示")
+        self.page_title = QLabel(self.PAGE_TITLES[0])
         self.page_title.setObjectName("pageTitle")
         self.page_title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
         title_bar_layout.addWidget(self.page_title)
@@ -204,28 +232,10 @@ class MainWindow(QMainWindow):
         self.content_stack = QStackedWidget()
         self.content_stack.setObjectName("contentStack")
         
-        # 将各个页面添加到堆叠窗口中
-        def add_page_to_stack(widget):
-            container = QWidget()
-            layout = QVBoxLayout(container)
-            layout.setContentsMargins(20, 20, 20, 20)
-            
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setWidget(widget)
-            scroll_area.setStyleSheet("border: none;")
-            layout.addWidget(scroll_area)
-            
-            return container
-            
-        # 添加页面到堆叠窗口
-        self.content_stack.addWidget(add_page_to_stack(self.wave_display_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.source_detection_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.batch_processing_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.model_setting_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.file_upload_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.settings_widget))
-        self.content_stack.addWidget(add_page_to_stack(self.theme_settings_controller.get_view()))
+        # 先为每个页面放置空白占位，默认页面在窗口显示后创建，其余页面首次切换时创建
+        for _ in self._page_factories:
+            self.content_stack.addWidget(QWidget())
+        QTimer.singleShot(0, lambda: self.ensure_page(0))
         
         main_container_layout.addWidget(self.content_stack)
         
@@ -233,14 +243,15 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.sidebar)
         main_layout.addWidget(main_container, 1)
         
-        # 连接按钮信号
-        self.btn_wave_display.clicked.connect(lambda: self.switch_page(0, "波数据展示"))
-        self.btn_source_detection.clicked.connect(lambda: self.switch_page(1, "源位置检测"))
-        self.btn_batch_processing.clicked.connect(lambda: self.switch_page(2, "批量处理"))
-        self.btn_velocity_model.clicked.connect(lambda: self.switch_page(3, "速度模型"))
-        self.btn_file_upload.clicked.connect(lambda: self.switch_page(4, "文件管理"))
-        self.btn_settings.clicked.connect(lambda: self.switch_page(5, "系统设置"))
-        self.btn_theme_settings.clicked.connect(lambda: self.switch_page(6, "主题设置"))
+        # 导航按钮加入互斥按钮组，按钮ID即页面索引
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        for index, btn in enumerate([self.btn_wave_display, self.btn_source_detection,
+                                     self.btn_batch_processing, self.btn_velocity_model,
+                                     self.btn_file_upload, self.btn_settings,
+                                     self.btn_theme_settings]):
+            self.nav_group.addButton(btn, index)
+        self.nav_group.idClicked.connect(self.switch_page)
         
         # 添加刷新事件
         self.refresh_btn.clicked.connect(self.refresh_current_page)
@@ -249,59 +260,215 @@ class MainWindow(QMainWindow):
         self.btn_wave_display.setChecked(True)
         
         self.setCentralWidget(central_widget)
+        
+        central_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+        central_widget.update()
+
+    def add_page_to_stack(self, widget, scroll=True):
+        """将页面视图包装到带边距的容器中，scroll为True时再套一层滚动区域"""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        if not scroll:
+            layout.addWidget(widget)
+            return container
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(widget)
+        scroll_area.setStyleSheet("border: none;")
+        layout.addWidget(scroll_area)
+        
+        return container
+
+    def ensure_page(self, index):
+        """确保指定索引的页面已创建，未创建时创建视图和控制器并替换占位部件"""
+        if index in self._pages:
+            return self._pages[index]
+        
+        widget = self._page_factories[index]()
+        is_current = self.content_stack.currentIndex() == index
+        placeholder = self.content_stack.widget(index)
+        scroll = index not in self.SELF_SCROLLING_PAGES
+        # 替换占位部件期间暂停内容区更新，避免中间状态触发重绘
+        self.content_stack.setUpdatesEnabled(False)
+        self.content_stack.insertWidget(index, self.add_page_to_stack(widget, scroll))
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if is_current:
+            self.content_stack.setCurrentIndex(index)
+        self.content_stack.setUpdatesEnabled(True)
+        
+        self._pages[index] = widget
+        return widget
+
+    def _create_wave_display_page(self):
+        """创建波数据展示页面"""
+        from Views.WaveDisplayWidget import WaveDisplayWidget
+        from Controllers.WaveDisplayWidgetController import WaveDisplayWidgetController
+
+        self.wave_display_widget = WaveDisplayWidget()
+        self.wave_display_controller = WaveDisplayWidgetController(self.wave_display_widget)
+        return self.wave_display_widget
+
+    def _create_source_detection_page(self):
+        """创建源位置检测页面"""
+        from Views.SourceDetectionWidget import SourceDetectionWidget
+        from Controllers.SourceDetectionWidgetController import SourceDetectionWidgetController
+
+        self.source_detection_widget = SourceDetectionWidget()
+        self.source_detection_controller = SourceDetectionWidgetController(self.source_detection_widget)
+        return self.source_detection_widget
+
+    def _create_batch_processing_page(self):
+        """创建批量处理页面"""
+        from Views.BatchProcessingWidget import BatchProcessingWidget
+        from Controllers.BatchProcessingWidgetController import BatchProcessingWidgetController
+
+        self.batch_processing_widget = BatchProcessingWidget()
+        self.batch_processing_controller = BatchProcessingWidgetController(self.batch_processing_widget)
+        return self.batch_processing_widget
+
+    def _create_model_setting_page(self):
+        """创建速度模型页面"""
+        from Views.ModelSettingWidget import ModelSettingWidget
+        from Controllers.ModelSettingWidgetController import ModelSettingWidgetController
+
+        self.model_setting_widget = ModelSettingWidget()
+        self.model_setting_controller = ModelSettingWidgetController(self.model_setting_widget)
+        return self.model_setting_widget
+
+    def _create_file_upload_page(self):
+        """创建文件管理页面，并显示创建前已加载的数据信息"""
+        from Views.FileUploadWidget import FileUploadWidget
+        from Controllers.FileUploadWidgetController import FileUploadWidgetController
+
+        self.file_upload_widget = FileUploadWidget()
+        self.file_upload_controller = FileUploadWidgetController(self.file_upload_widget)
+        
+        from Models.TraceFile import TraceFile
+        trace_file = TraceFile()
+        if trace_file.basic_info:
+            self.file_upload_widget.show_file_info(trace_file.get_wave_file_info())
+        if trace_file.location_data is not None:
+            self.file_upload_widget.show_location_info(trace_file.get_detector_location())
+        return self.file_upload_widget
+
+    def _create_settings_page(self):
+        """创建系统设置页面"""
+        from Views.SettingsWidget import SettingsWidget
+        from Controllers.SettingsWidgetController import SettingsWidgetController
+
+        self.settings_widget = SettingsWidget()
+        self.settings_controller = SettingsWidgetController(self.settings_widget)
+        return self.settings_widget
 
-    def switch_page(self, index, title):
+    def _create_theme_settings_page(self):
+        """创建主题设置页面"""
+        from Controllers.ThemeSettingsWidgetController import ThemeSettingsWidgetController
+
+        self.theme_settings_controller = ThemeSettingsWidgetController()
+        # 连接主题变更信号
+        self.theme_settings_controller.themeChanged.connect(self.apply_theme)
+        return self.theme_settings_controller.get_view()
+
+    def show_wave_file_info(self, file_info):
+        """在文件管理页面显示波形文件信息，页面未创建时由创建时补充显示"""
+        if 4 in self._pages:
+            self.file_upload_widget.show_file_info(file_info)
+
+    def show_location_info(self, location_info):
+        """在文件管理页面显示检波器位置信息，页面未创建时由创建时补充显示"""
+        if 4 in self._pages:
+            self.file_upload_widget.show_location_info(location_info)
+
+    def on_default_wave_loaded(self, wave_data, file_info, message):
+        """默认波形数据读取完成后在主线程中写入TraceFile并更新界面"""
+        from Models.TraceFile import TraceFile
+        trace_file = TraceFile()
+        # 用户已在后台加载期间手动加载了波形文件时，不用默认数据覆盖
+        if trace_file.basic_info is not None:
+            return
+        trace_file.set_wave_data(wave_data, file_info)
+        self.show_wave_file_info(file_info)
+        self.update_status(message)
+
+    def on_default_location_loaded(self, location_info, message):
+        """默认检波器位置读取完成后在主线程中写入TraceFile并更新界面"""
+        from Models.TraceFile import TraceFile
+        trace_file = TraceFile()
+        # 用户已在后台加载期间手动加载了位置文件时，不用默认数据覆盖
+        if trace_file.location_data is not None:
+            return
+        trace_file.set_location_data(location_info)
+        self.show_location_info(location_info)
+        self.update_status(message)
+
+    def switch_page(self, index):
         # 更新页面标题
-        self.page_title.setText(title)
+        self.page_title.setText(self.PAGE_TITLES[index])
         
-        # 切换页面
+        # 切换页面，首次切换时创建页面
+        self.ensure_page(index)
         self.content_stack.setCurrentIndex(index)
         
-        # 取消所有按钮的选中状态
-        for btn in [self.btn_wave_display, self.btn_source_detection, self.btn_batch_processing,
-                   self.btn_velocity_model, self.btn_file_upload, self.btn_settings, 
-                   self.btn_theme_settings]:
-            btn.setChecked(False)
-        
-        # 根据索引选中对应的按钮
-        if index == 0:
-            self.btn_wave_display.setChecked(True)
-        elif index == 1:
-            self.btn_source_detection.setChecked(True)
-        elif index == 2:
-            self.btn_batch_processing.setChecked(True)
-        elif index == 3:
-            self.btn_velocity_model.setChecked(True)
-        elif index == 4:
-            self.btn_file_upload.setChecked(True)
-        elif index == 5:
-            self.btn_settings.setChecked(True)
-        elif index == 6:
-            self.btn_theme_settings.setChecked(True)
+        # 选中对应的按钮，互斥按钮组会自动取消其他按钮的选中状态
+        button = self.nav_group.button(index)
+        if not button.isChecked():
+            button.setChecked(True)
 
     def refresh_current_page(self):
-        # 获取当前页面索引
-        current_index = self.content_stack.currentIndex()
-        
-        # 基于索引刷新不同页面
-        if current_index == 0:  # 波数据展示
-            QMessageBox.information(self, "刷新", "波数据展示页面已刷新")
-        elif current_index == 1:  # 源位置检测
-            QMessageBox.information(self, "刷新", "源位置检测页面已刷新")
-        elif current_index == 2:  # 速度模型
-            QMessageBox.information(self, "刷新", "速度模型页面已刷新")
-        elif current_index == 3:  # 文件管理
-            QMessageBox.information(self, "刷新", "文件管理页面已刷新")
-        elif current_index == 4:  # 系统设置
-            QMessageBox.information(self, "刷新", "系统设置页面已刷新")
-        elif current_index == 5:  # 主题设置
-            QMessageBox.information(self, "刷新", "主题设置页面已刷新")
+        """请求刷新当前页面，同一轮事件循环中的多次点击合并为一次刷新"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """刷新当前页面，并在状态栏中提示刷新结果"""
+        self._refresh_pending = False
+        index = self.content_stack.currentIndex()
+        
+        # 页面视图提供refresh方法时调用它刷新页面内容
+        refresh = getattr(self._pages.get(index), "refresh", None)
+        if callable(refresh):
+            refresh()
+        
+        # 按当前页面索引查找页面标题
+        message = f"{self.PAGE_TITLES[index]}页面已刷新"
+        self.update_status(message, progress=100)
+        QTimer.singleShot(1500, lambda: self._reset_status(message))
+
+    def _reset_status(self, message):
+        """状态栏仍显示指定信息时恢复为就绪状态"""
+        if self.status_message.text() == message:
+            self.update_status("系统就绪")
 
     def update_status(self, message, progress=-1):
-        """更新状态栏信息"""
-        # 确保UI更新在主线程执行
+        """更新状态栏信息，可在任意线程中调用"""
+        # 非主线程的调用通过队列连接转发到主线程执行，不丢弃更新
         if threading.current_thread() is not threading.main_thread():
+            QMetaObject.invokeMethod(self, "_update_status_impl", Qt.ConnectionType.QueuedConnection,
+                                     Q_ARG(str, message), Q_ARG(int, progress))
+            return
+        
+        self._update_status_impl(message, progress)
+
+    @pyqtSlot(str, int)
+    def _update_status_impl(self, message, progress):
+        """在主线程中记录最新的状态，由定时器合并后统一更新界面"""
+        self._pending_status = (message, progress)
+        if not self._status_timer.isActive():
+            self._status_timer.start(30)
+
+    def _flush_status(self):
+        """将最新的状态更新到状态栏文字、进度条和指示灯，中间状态直接丢弃"""
+        if self._pending_status is None:
             return
+        message, progress = self._pending_status
+        self._pending_status = None
         
         self.status_message.setText(message)
         
@@ -311,42 +478,87 @@ class MainWindow(QMainWindow):
             
             # 根据进度更改指示灯颜色
             if progress < 30:
-                self.status_indicator.setStyleSheet("background-color: #F44336; border-radius: 8px;")
+                self._set_indicator_color(self.INDICATOR_RED)
             elif progress < 70:
-                self.status_indicator.setStyleSheet("background-color: #FFC107; border-radius: 8px;")
+                self._set_indicator_color(self.INDICATOR_AMBER)
             else:
-                self.status_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 8px;")
+                self._set_indicator_color(self.INDICATOR_GREEN)
         else:
             self.progress_bar.setVisible(False)
-            self.status_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 8px;")
+            self._set_indicator_color(self.INDICATOR_GREEN)
 
     def apply_theme(self):
         """应用当前主题到整个应用程序"""
         # 获取当前主题样式表
         stylesheet = self.theme_manager.get_stylesheet()
         
-        # 更新侧边栏样式
+        # 更新侧边栏样式（侧边栏使用独立的样式表）
         self.sidebar.setStyleSheet(self.theme_manager.get_sidebar_stylesheet())
         
-        # 更新所有界面组件的样式
-        self.file_upload_widget.setStyleSheet(stylesheet)
-        self.wave_display_widget.setStyleSheet(stylesheet)
-        self.source_detection_widget.setStyleSheet(stylesheet)
-        self.settings_widget.setStyleSheet(stylesheet)
-        self.model_setting_widget.setStyleSheet(stylesheet)
-        
-        # 重新应用全局样式表
+        # 全局样式表会级联到所有子部件，只需设置一次
         QApplication.instance().setStyleSheet(stylesheet)
         
-        # 更新状态栏
-        self.status_bar.setStyleSheet(stylesheet)
-        
         # 更新状态信息
         self.update_status("主题已更新")
-        
-        # 刷新当前页面
-        current_index = self.content_stack.currentIndex()
-        self.switch_page(current_index, self.page_title.text())
+
+
+class DefaultLoaderThread(QThread):
+    """
+    在后台线程中读取测试用的默认数据（波形文件和检波器位置文件）
+    线程只读取到局部对象，由主线程在信号处理中写入TraceFile单例
+    """
+    loaded_wave = pyqtSignal(object, object, str)  # 波形数据、波形文件信息、状态信息
+    loaded_location = pyqtSignal(object, str)  # 检波器位置数据、状态信息
+    load_failed = pyqtSignal(str)  # 失败信息
+
+    def __init__(self, config, parent=None):
+        super().__init__(parent)
+        self.config = config
+
+    def run(self):
+        try:
+            from Models.TraceFile import TraceFile
+
+            # 尝试加载默认的波形数据
+            default_sgy_path = self.config.get("Default", "default_sgy_path")
+            if default_sgy_path and os.path.exists(default_sgy_path):
+                wave_data, file_info = TraceFile.read_wave_data(default_sgy_path)
+                self.loaded_wave.emit(wave_data, file_info, f"已加载默认波形数据: {default_sgy_path}")
+                print(f"已加载默认波形数据: {default_sgy_path}")
+            else:
+                # 尝试加载当前目录中的.sgy文件
+                for file in glob.glob('*.sgy'):
+                    try:
+                        wave_data, file_info = TraceFile.read_wave_data(file)
+                        self.loaded_wave.emit(wave_data, file_info, f"已加载本地波形数据: {file}")
+                        print(f"已加载本地波形数据: {file}")
+                        break
+                    except Exception:
+                        print(f"加载本地波形数据失败: {file}")
+                        print(traceback.format_exc())
+
+            # 尝试加载默认的检波器位置数据
+            default_xlsx_path = self.config.get("Default", "default_xlsx_path")
+            if default_xlsx_path and os.path.exists(default_xlsx_path):
+                location_data = TraceFile.read_location_data(default_xlsx_path)
+                self.loaded_location.emit(location_data, f"已加载默认检波器位置: {default_xlsx_path}")
+                print(f"已加载默认检波器位置: {default_xlsx_path}")
+            else:
+                # 尝试加载当前目录中的xlsx文件
+                for file in glob.glob('*.xlsx'):
+                    try:
+                        location_data = TraceFile.read_location_data(file)
+                        self.loaded_location.emit(location_data, f"已加载本地检波器位置数据: {file}")
+                        print(f"已加载本地检波器位置数据: {file}")
+                        break
+                    except Exception:
+                        print(f"加载本地检波器位置数据失败: {file}")
+                        print(traceback.format_exc())
+        except Exception as e:
+            print(f"加载默认数据失败: {e}")
+            print(traceback.format_exc())
+            self.load_failed.emit(f"加载默认数据失败: {str(e)}")
+
 
 if __name__ == "__main__":
     try:
@@ -356,6 +568,7 @@ if __name__ == "__main__":
         app.setStyle("Fusion")
         
         # 初始化配置系统
+        config = None
         try:
             config = Config()
             print("配置系统初始化成功")
@@ -369,57 +582,20 @@ if __name__ == "__main__":
         app.setStyleSheet(theme_manager.get_stylesheet())
             
         # 创建主窗口
-        window = MainWindow()
+        window = MainWindow(theme_manager)
 
-        # 加载测试用的默认数据
-        try:
-            trace_file = TraceFile()
-            
-            # 尝试加载默认的波形数据
-            default_sgy_path = config.get("Default", "default_sgy_path")
-            if default_sgy_path and os.path.exists(default_sgy_path):
-                trace_file.load_wave_data(default_sgy_path)
-                window.file_upload_widget.show_file_info(trace_file.get_wave_file_info())
-                window.update_status(f"已加载默认波形数据: {default_sgy_path}")
-                print(f"已加载默认波形数据: {default_sgy_path}")
-            else:
-                # 尝试加载当前目录中的.sgy文件
-                for file in os.listdir('.'):
-                    if file.endswith('.sgy'):
-                        try:
-                            trace_file.load_wave_data(file)
-                            window.file_upload_widget.show_file_info(trace_file.get_wave_file_info())
-                            window.update_status(f"已加载本地波形数据: {file}")
-                            print(f"已加载本地波形数据: {file}")
-                            break
-                        except:
-                            continue
-            
-            # 尝试加载默认的检波器位置数据
-            default_xlsx_path = config.get("Default", "default_xlsx_path")
-            if default_xlsx_path and os.path.exists(default_xlsx_path):
-                trace_file.load_location_data(default_xlsx_path)
-                window.file_upload_widget.show_location_info(trace_file.get_detector_location())
-                window.update_status(f"已加载默认检波器位置: {default_xlsx_path}")
-                print(f"已加载默认检波器位置: {default_xlsx_path}")
-            else:
-                # 尝试加载当前目录中的xlsx文件
-                for file in os.listdir('.'):
-                    if file.endswith('.xlsx'):
-                        try:
-                            trace_file.load_location_data(file)
-                            window.file_upload_widget.show_location_info(trace_file.get_detector_location())
-                            window.update_status(f"已加载本地检波器位置数据: {file}")
-                            print(f"已加载本地检波器位置数据: {file}")
-                            break
-                        except:
-                            continue
-        except Exception as e:
-            print(f"加载默认数据失败: {e}")
-            print(traceback.format_exc())
-            window.update_status(f"加载默认数据失败: {str(e)}")
-        
         window.show()
+        # 窗口显示后在后台线程中加载默认数据，避免阻塞首次绘制
+        # 配置系统初始化失败时没有默认路径可用，跳过默认数据加载
+        if config is not None:
+            default_loader = DefaultLoaderThread(config, window)
+            queued = Qt.ConnectionType.QueuedConnection
+            default_loader.loaded_wave.connect(window.on_default_wave_loaded, queued)
+            default_loader.loaded_location.connect(window.on_default_location_loaded, queued)
+            default_loader.load_failed.connect(window.update_status, queued)
+            default_loader.start()
+        else:
+            window.update_status("加载默认数据失败: 配置系统初始化失败")
         sys.exit(app.exec())
     except Exception as e:
         print(f"程序启动失败: {e}")
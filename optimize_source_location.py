@@ -2,7 +2,6 @@
 import numpy as np
 import time
 import traceback
-from functools import lru_cache
 
 def optimized_calculate_source_location(wave_data, location_data, sample_interval, time_range, update_progress, grid_params=None):
     """
@@ -91,8 +90,17 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
         from Services.ssatop import normalize_data
         
         # 预处理数据
-        # 规范化波形数据
+        # 规范化波形数据，并按行存入连续的float32二维数组（不足部分补零），记录各道的实际长度
         normalized_data = [normalize_data(trace) for trace in wave_data]
+        n_traces = len(normalized_data)
+        trace_lengths = np.array([len(trace) for trace in normalized_data], dtype=np.int64)
+        if (trace_lengths == trace_lengths[0]).all():
+            norm_mat = np.array(normalized_data, dtype=np.float32)
+        else:
+            norm_mat = np.zeros((n_traces, trace_lengths.max()), dtype=np.float32)
+            for i, trace in enumerate(normalized_data):
+                norm_mat[i, :len(trace)] = trace
+        del normalized_data
         
         # 创建时间范围数组
         if isinstance(time_range, dict) and 'start' in time_range and 'end' in time_range:
@@ -104,73 +112,23 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
             
         time_range_array = np.arange(time_start, time_end, time_slice)
         
-        # 创建亮度计算缓存
-        brightness_cache = {}
-        
-        # 使用LRU缓存优化频繁调用的函数
-        @lru_cache(maxsize=None)
-        def amp_norm(trace_index):
-            return normalized_data[trace_index]
+        # 取出检波器坐标数组，使亮度计算可以对所有道一次性完成；
+        # 坐标、种群和各道数据均使用float32，减少亮度计算中的内存带宽
+        det_x = np.ascontiguousarray(location_data['x'], dtype=np.float32)[:n_traces]
+        det_y = np.ascontiguousarray(location_data['y'], dtype=np.float32)[:n_traces]
+        det_z = np.ascontiguousarray(location_data['z'], dtype=np.float32)[:n_traces]
         
-        @lru_cache(maxsize=None)
-        def time_delay(x, y, z, trace_index):
-            """计算从点(x,y,z)到检波器的时间延迟"""
-            detector_x = location_data['x'][trace_index]
-            detector_y = location_data['y'][trace_index]
-            detector_z = location_data['z'][trace_index]
-            
-            distance = np.sqrt((x - detector_x)**2 + (y - detector_y)**2 + (z - detector_z)**2)
-            delay = distance / speed
-            return delay
+        window_size = 5  # 局部窗口大小
+        speed_f32 = np.float32(speed)
+        sample_interval_f32 = np.float32(sample_interval)
         
-        def get_local_max(trace_data, time):
-            """获取给定时间点附近的局部最大值"""
-            sample_index = int(time / sample_interval)
-            window_size = 5  # 局部窗口大小
-            
-            start_idx = max(0, sample_index - window_size)
-            end_idx = min(len(trace_data) - 1, sample_index + window_size)
-            
-            if start_idx >= end_idx:
-                return 0
-                
-            window_data = trace_data[start_idx:end_idx+1]
-            local_max = np.max(window_data)
-            return local_max
+        # 亮度计算内核：numba可用时为按个体并行的编译循环，否则为NumPy广播实现
+        from Services.ga_fitness import population_fitness, mutate_inplace
         
-        def br(x, y, z, t):
-            """计算给定点的亮度值"""
-            # 使用缓存避免重复计算
-            cache_key = (x, y, z, t)
-            if cache_key in brightness_cache:
-                return brightness_cache[cache_key]
-                
-            brightness = 0
-            valid_traces = 0
-            
-            for i in range(len(wave_data)):
-                delay = time_delay(x, y, z, i)
-                arrival_time = t + delay
-                
-                # 检查时间是否在有效范围内
-                if arrival_time < 0 or arrival_time >= len(amp_norm(i)) * sample_interval:
-                    continue
-                    
-                # 获取局部最大值作为振幅
-                amplitude = get_local_max(amp_norm(i), arrival_time)
-                brightness += amplitude
-                valid_traces += 1
-                
-            # 如果没有有效的检波器数据，返回0
-            if valid_traces == 0:
-                return 0
-                
-            # 归一化亮度值
-            brightness = brightness / valid_traces
-            
-            # 缓存结果
-            brightness_cache[cache_key] = brightness
-            return brightness
+        def fitness_pop(individuals):
+            """批量计算一组个体(形状为(P, 4)，每行为x, y, z, t)的亮度值，返回形状为(P,)的数组"""
+            return population_fitness(np.ascontiguousarray(individuals, dtype=np.float32), det_x, det_y, det_z,
+                                      norm_mat, trace_lengths, sample_interval_f32, speed_f32, window_size)
             
         # 设置网格范围
         grid_x = np.arange(location_data['x'].min(), location_data['x'].max() + 1, length)
@@ -178,6 +136,16 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
         grid_z = np.arange(z_min, z_max, height)
         grid_t = time_range_array
         
+        # 网格边界、时间步长和变异幅度基准只计算一次，遗传算法循环中直接使用
+        x_min, x_max = float(grid_x.min()), float(grid_x.max())
+        y_min, y_max = float(grid_y.min()), float(grid_y.max())
+        z_lo, z_hi = float(grid_z.min()), float(grid_z.max())
+        t_min, t_max = float(grid_t.min()), float(grid_t.max())
+        low_bounds = np.array([x_min, y_min, z_lo, t_min], dtype=np.float32)
+        high_bounds = np.array([x_max, y_max, z_hi, t_max], dtype=np.float32)
+        time_step = float(time_range_array[1] - time_range_array[0])
+        step_sizes = np.array([length, length, height, time_step])
+        
         # 从网格参数中获取遗传算法参数
         population_size = 300  # 默认值
         generations = 20  # 默认值
@@ -193,61 +161,40 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
                 
         print(f"源位置检测: 使用遗传算法参数: 种群大小={population_size}, 迭代次数={generations}, 变异率={mutation_rate}")
         
-        # 尝试导入并行计算库
-        try:
-            import multiprocessing
-            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-            num_cores = multiprocessing.cpu_count()
-            use_parallel = num_cores > 1 and population_size >= 100
-            print(f"检测到{num_cores}个CPU核心，{'启用' if use_parallel else '不启用'}并行计算")
-        except ImportError:
-            use_parallel = False
-            print("未找到multiprocessing模块，使用单线程计算")
-        
         # 初始化种群 - 改进的初始化策略
-        population = np.zeros((population_size, 4))
+        population = np.zeros((population_size, 4), dtype=np.float32)
         
         # 50%的个体随机分布
         random_population = np.random.uniform(
-            low=[grid_x.min(), grid_y.min(), grid_z.min(), grid_t.min()],
-            high=[grid_x.max(), grid_y.max(), grid_z.max(), grid_t.max()],
+            low=low_bounds,
+            high=high_bounds,
             size=(int(population_size * 0.5), 4)
         )
         population[:int(population_size * 0.5)] = random_population
         
-        # 30%的个体在网格点上
-        grid_points = np.array(np.meshgrid(
-            np.linspace(grid_x.min(), grid_x.max(), 10),
-            np.linspace(grid_y.min(), grid_y.max(), 10),
-            np.linspace(grid_z.min(), grid_z.max(), 5),
-            np.linspace(grid_t.min(), grid_t.max(), 5)
-        )).T.reshape(-1, 4)
-        
-        if len(grid_points) > 0:
-            grid_indices = np.random.choice(len(grid_points), int(population_size * 0.3), replace=True)
-            population[int(population_size * 0.5):int(population_size * 0.8)] = grid_points[grid_indices]
+        # 30%的个体按拉丁超立方采样分布：每一维都分成n_lhs层，每层恰好一个点
+        lhs_start, lhs_end = int(population_size * 0.5), int(population_size * 0.8)
+        n_lhs = lhs_end - lhs_start
+        if n_lhs > 0:
+            strata = np.argsort(np.random.random((4, n_lhs)), axis=1).T
+            u = (strata + np.random.random((n_lhs, 4))) / n_lhs
+            population[lhs_start:lhs_end] = low_bounds + u * (high_bounds - low_bounds)
         
         # 20%的个体在检波器附近
-        detector_points = np.zeros((int(population_size * 0.2), 4))
-        for i in range(int(population_size * 0.2)):
-            # 随机选择一个检波器
-            detector_idx = np.random.randint(0, len(location_data['x']))
-            # 在检波器周围随机生成点
-            detector_points[i, 0] = location_data['x'][detector_idx] + np.random.uniform(-length*5, length*5)
-            detector_points[i, 1] = location_data['y'][detector_idx] + np.random.uniform(-length*5, length*5)
-            detector_points[i, 2] = location_data['z'][detector_idx] + np.random.uniform(-height*5, height*5)
-            detector_points[i, 3] = np.random.uniform(grid_t.min(), grid_t.max())
+        n_detector_points = int(population_size * 0.2)
+        # 一次性随机选择检波器，并在其周围随机生成点
+        detector_idx = np.random.randint(0, len(location_data['x']), n_detector_points)
+        detector_points = np.empty((n_detector_points, 4))
+        detector_points[:, 0] = np.asarray(location_data['x'])[detector_idx] + np.random.uniform(-length*5, length*5, n_detector_points)
+        detector_points[:, 1] = np.asarray(location_data['y'])[detector_idx] + np.random.uniform(-length*5, length*5, n_detector_points)
+        detector_points[:, 2] = np.asarray(location_data['z'])[detector_idx] + np.random.uniform(-height*5, height*5, n_detector_points)
+        detector_points[:, 3] = np.random.uniform(t_min, t_max, n_detector_points)
         
         population[int(population_size * 0.8):] = detector_points
         
         # 确保所有点都在边界内
-        population[:, 0] = np.clip(population[:, 0], grid_x.min(), grid_x.max())
-        population[:, 1] = np.clip(population[:, 1], grid_y.min(), grid_y.max())
-        population[:, 2] = np.clip(population[:, 2], grid_z.min(), grid_z.max())
-        population[:, 3] = np.clip(population[:, 3], grid_t.min(), grid_t.max())
+        np.clip(population, low_bounds, high_bounds, out=population)
         
-        # 使用局部缓存提高性能
-        local_fitness_cache = {}
         best_brightness = -np.inf
         best_point = None
         
@@ -255,48 +202,28 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
         no_improvement_limit = 10  # 连续10代无改进则提前停止
         no_improvement_count = 0
         improvement_threshold = 0.001  # 改进小于0.1%视为无改进
+        convergence_cv = 1e-3  # 适应度变异系数低于该值视为种群已收敛
         
         # 自适应变异率参数
         initial_mutation_rate = mutation_rate
         min_mutation_rate = 0.05
         
-        # 批量计算适应度的函数
-        def calculate_fitness_batch(individuals):
-            results = np.zeros(len(individuals))
-            for i, ind in enumerate(individuals):
-                # 转换为元组以便缓存
-                ind_tuple = tuple(ind)
-                if ind_tuple in local_fitness_cache:
-                    results[i] = local_fitness_cache[ind_tuple]
-                else:
-                    fitness_val = br(ind[0], ind[1], ind[2], ind[3])
-                    local_fitness_cache[ind_tuple] = fitness_val
-                    results[i] = fitness_val
-            return results
-        
-        # 使用并行计算时的批处理函数
-        def parallel_fitness(population):
-            if not use_parallel:
-                return calculate_fitness_batch(population)
-            
-            # 将种群分成多个批次
-            batch_size = max(10, population_size // (num_cores * 2))
-            batches = [population[i:i+batch_size] for i in range(0, len(population), batch_size)]
-            
-            # 使用线程池并行计算
-            with ThreadPoolExecutor(max_workers=num_cores) as executor:
-                results = list(executor.map(calculate_fitness_batch, batches))
-            
-            # 合并结果
-            return np.concatenate(results)
-        
         # 记录开始时间
         start_time = time.time()
         
         # 主遗传算法循环
+        # 种群的双缓冲区，每代交替使用，避免每代重新分配种群数组
+        next_population = np.empty_like(population)
+        
+        # 已知的个体适应度：精英和父代个体原样进入下一代，沿用其适应度，NaN表示需要重新计算
+        known_fitness = np.full(population_size, np.nan)
+        
         for generation in range(generations):
-            # 计算适应度 - 使用向量化或并行计算
-            fitness = parallel_fitness(population)
+            # 计算适应度 - 只对新产生的个体进行一次向量化计算
+            fitness = known_fitness
+            unknown = np.isnan(fitness)
+            if unknown.any():
+                fitness[unknown] = fitness_pop(population[unknown])
             
             # 更新进度
             current_progress = int((generation + 1) / generations * 100)
@@ -328,6 +255,12 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
                 print(f"连续{no_improvement_limit}代无显著改进，提前停止算法")
                 break
             
+            # 种群收敛检查：适应度的变异系数极小时种群已坍缩到同一点附近，不再继续进化
+            fitness_cv = fitness.std() / (abs(fitness.mean()) + 1e-9)
+            if generation > 5 and fitness_cv < convergence_cv:
+                print(f"第{generation}代: 种群已收敛（适应度变异系数{fitness_cv:.2e}），提前停止算法")
+                break
+            
             # 自适应变异率 - 根据进度和收敛情况调整
             if no_improvement_count > 5:
                 # 增加变异率以跳出局部最优
@@ -347,18 +280,16 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
             elites = population[elite_indices].copy()
 
             # 锦标赛选择
+            # 一次抽取所有锦标赛的参赛者（有放回抽样），每行取适应度最高者为父代
             tournament_size = 3
-            parents = []
-            for _ in range(population_size // 2):
-                participants_idx = np.random.choice(population_size, tournament_size, replace=False)
-                winner_idx = participants_idx[np.argmax(fitness[participants_idx])]
-                parents.append(population[winner_idx])
-
-            parents = np.array(parents)
+            n_parents = population_size // 2
+            participants_idx = np.random.randint(0, population_size, (n_parents, tournament_size))
+            parent_indices = participants_idx[np.arange(n_parents), fitness[participants_idx].argmax(axis=1)]
+            parents = population[parent_indices]
 
             # 交叉操作 - 使用向量化操作
             num_offspring = population_size - len(parents) - len(elites)
-            offspring = np.zeros((num_offspring, 4))
+            offspring = np.zeros((num_offspring, 4), dtype=np.float32)
             
             # 随机选择父母对
             parent_indices1 = np.random.randint(0, len(parents), num_offspring)
@@ -367,44 +298,36 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
             # 生成交叉掩码
             crossover_type = np.random.random(num_offspring) < 0.5
             
-            # 单点交叉
+            # 单点交叉：交叉点之前的基因来自父代1，之后的来自父代2
             single_point_indices = np.where(crossover_type)[0]
             if len(single_point_indices) > 0:
                 crossover_points = np.random.randint(1, 4, len(single_point_indices))
-                for i, idx in enumerate(single_point_indices):
-                    cp = crossover_points[i]
-                    offspring[idx, :cp] = parents[parent_indices1[idx], :cp]
-                    offspring[idx, cp:] = parents[parent_indices2[idx], cp:]
+                cp_mask = np.arange(4) < crossover_points[:, None]
+                offspring[single_point_indices] = np.where(cp_mask,
+                                                           parents[parent_indices1[single_point_indices]],
+                                                           parents[parent_indices2[single_point_indices]])
             
-            # 均匀交叉
+            # 均匀交叉：每个基因以相同概率来自任一父代
             uniform_indices = np.where(~crossover_type)[0]
             if len(uniform_indices) > 0:
-                for i, idx in enumerate(uniform_indices):
-                    mask = np.random.random(4) < 0.5
-                    offspring[idx] = np.where(mask, 
-                                             parents[parent_indices1[idx]], 
-                                             parents[parent_indices2[idx]])
+                mask = np.random.random((len(uniform_indices), 4)) < 0.5
+                offspring[uniform_indices] = np.where(mask,
+                                                      parents[parent_indices1[uniform_indices]],
+                                                      parents[parent_indices2[uniform_indices]])
 
-            # 变异操作 - 使用向量化操作
-            mutation_mask = np.random.rand(*offspring.shape) < mutation_rate
-            
-            # 变异幅度随迭代次数减小
+            # 变异操作 - 变异幅度随迭代次数减小，变异后确保个体在边界内
             mutation_scale = 1.0 - 0.5 * (generation / generations)
-            mutation_values = np.random.uniform(
-                low=[-length * mutation_scale, -length * mutation_scale, -height * mutation_scale, -(time_range_array[1] - time_range_array[0]) * mutation_scale],
-                high=[length * mutation_scale, length * mutation_scale, height * mutation_scale, (time_range_array[1] - time_range_array[0]) * mutation_scale],
-                size=offspring.shape
-            )
-            offspring += mutation_mask * mutation_values
-
-            # 确保个体在边界内
-            offspring[:, 0] = np.clip(offspring[:, 0], grid_x.min(), grid_x.max())
-            offspring[:, 1] = np.clip(offspring[:, 1], grid_y.min(), grid_y.max())
-            offspring[:, 2] = np.clip(offspring[:, 2], grid_z.min(), grid_z.max())
-            offspring[:, 3] = np.clip(offspring[:, 3], grid_t.min(), grid_t.max())
+            mutate_inplace(offspring, mutation_rate, (step_sizes * mutation_scale).astype(np.float32),
+                           low_bounds, high_bounds)
 
-            # 新一代种群 - 包含精英
-            population = np.vstack((elites, parents, offspring))
+            # 新一代种群 - 包含精英，写入另一块预分配的缓冲区后与当前种群交换
+            n_kept = elite_count + len(parents)
+            next_population[:elite_count] = elites
+            next_population[elite_count:n_kept] = parents
+            next_population[n_kept:] = offspring
+            population, next_population = next_population, population
+            known_fitness = np.concatenate((fitness[elite_indices], fitness[parent_indices],
+                                            np.full(num_offspring, np.nan)))
             
             # 每5代进行一次局部搜索，对最佳点进行精细搜索
             if generation % 5 == 0 and best_point is not None:
@@ -412,22 +335,17 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
                 local_search_points = np.tile(best_point, (10, 1))
                 local_search_scale = 0.1 * (1.0 - generation / generations)  # 随迭代减小搜索范围
                 local_noise = np.random.uniform(
-                    low=[-length * local_search_scale, -length * local_search_scale, 
-                         -height * local_search_scale, -(time_range_array[1] - time_range_array[0]) * local_search_scale],
-                    high=[length * local_search_scale, length * local_search_scale, 
-                          height * local_search_scale, (time_range_array[1] - time_range_array[0]) * local_search_scale],
+                    low=-step_sizes * local_search_scale,
+                    high=step_sizes * local_search_scale,
                     size=(10, 4)
                 )
                 local_search_points += local_noise
                 
                 # 确保在边界内
-                local_search_points[:, 0] = np.clip(local_search_points[:, 0], grid_x.min(), grid_x.max())
-                local_search_points[:, 1] = np.clip(local_search_points[:, 1], grid_y.min(), grid_y.max())
-                local_search_points[:, 2] = np.clip(local_search_points[:, 2], grid_z.min(), grid_z.max())
-                local_search_points[:, 3] = np.clip(local_search_points[:, 3], grid_t.min(), grid_t.max())
+                np.clip(local_search_points, low_bounds, high_bounds, out=local_search_points)
                 
                 # 计算局部搜索点的适应度
-                local_fitness = calculate_fitness_batch(local_search_points)
+                local_fitness = fitness_pop(local_search_points)
                 local_best_idx = np.argmax(local_fitness)
                 
                 # 如果找到更好的点，更新最佳点
@@ -438,6 +356,7 @@ def optimized_calculate_source_location(wave_data, location_data, sample_interva
                     
                     # 将这个点添加到种群中
                     population[-1] = best_point.copy()
+                    known_fitness[-1] = best_brightness
         
         # 计算完成，更新进度为100%
         progress_wrapper(100, generations, 'completed')